@@ -53,18 +53,35 @@ def _load_cluster_config():
 _CLUSTER = _load_cluster_config()
 
 
+# name -> (st_mtime_ns, stripped contents) for _read_credential_file.
+_CREDENTIAL_CACHE: dict[str, tuple[int, str]] = {}
+
+
 def _read_credential_file(name: str) -> str:
     """Read a runtime credential file from ``data/``. Returns "" if absent.
 
     These files are written by the setup scripts (``scripts/setup_credentials.py``)
     and the Messenger bot registration step. They are intentionally NOT inline
     constants because they contain secrets and per-install values.
+
+    Memoized on the file's mtime: repeat calls cost one stat, and a rewritten
+    file (e.g. setup_credentials re-run) is picked up on the next call.
     """
     path = _BASE_DIR / "data" / name
     try:
-        return path.read_text(encoding="utf-8").strip()
+        mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        _CREDENTIAL_CACHE.pop(name, None)
+        return ""
+    cached = _CREDENTIAL_CACHE.get(name)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    try:
+        value = path.read_text(encoding="utf-8").strip()
     except FileNotFoundError:
         return ""
+    _CREDENTIAL_CACHE[name] = (mtime_ns, value)
+    return value
 
 
 # ---------------------------------------------------------------------------
@@ -137,6 +154,12 @@ HEARTBEAT_INTERVAL_SECONDS = int(getattr(_CLUSTER, "HEARTBEAT_INTERVAL_SECONDS",
 # If heartbeat hits LLM connectivity errors, pause heartbeat LLM calls
 # for this many seconds.
 HEARTBEAT_LLM_COOLDOWN_SECONDS = 600
+# Max planner tasks executed concurrently within one tick. Task runs are
+# I/O-bound (waiting on the agent loop), so a pool overlaps them, but each
+# task runs in its own LLM session and may edit data/memory.md; those edits
+# are not serialized. Only raise this when the HEARTBEAT.md tasks are
+# independent and none of them writes memory.
+HEARTBEAT_MAX_CONCURRENT_TASKS = 1
 # Active hours window (24h HH:MM). Heartbeat only runs in this window.
 HEARTBEAT_ACTIVE_START = getattr(_CLUSTER, "HEARTBEAT_ACTIVE_START", "00:00")
 HEARTBEAT_ACTIVE_END = getattr(_CLUSTER, "HEARTBEAT_ACTIVE_END", "23:59")
@@ -154,6 +177,14 @@ LLM_TIMEOUT_SECONDS = 3000
 STARTUP_RETRY_ATTEMPTS = 6
 # Base delay between startup retries (seconds, doubles each attempt).
 STARTUP_RETRY_DELAY = 1.0
+# Upper bound on a single startup retry sleep (seconds). Sleeps are drawn with
+# full jitter from [0, min(cap, base * 2**attempt)].
+STARTUP_RETRY_MAX_DELAY = 30.0
+# Consecutive Messenger outage failures (connect errors / 5xx) during startup
+# registration before further attempts fail fast, and how long they do so
+# (seconds). Hoonbot then starts in degraded mode and keeps retrying.
+MESSENGER_CIRCUIT_FAIL_THRESHOLD = 3
+MESSENGER_CIRCUIT_RESET_SECONDS = 30.0
 # How many recent messages to scan per room on startup catch-up.
 CATCHUP_MESSAGE_LIMIT = 20
 # Max message length before auto-splitting into multiple Messenger sends.
@@ -168,6 +199,15 @@ MEMORY_FLUSH_THRESHOLD = 30
 MAX_CONVERSATION_TOKENS = 200_000
 # Stream LLM responses with live tool-status updates.
 STREAMING_ENABLED = True
+# How long idle pooled connections to Messenger and the LLM API are kept
+# (seconds). httpx defaults to 5s, which drops sockets between heartbeat
+# ticks and typing refreshes; neither server closes idle sockets sooner.
+HTTP_KEEPALIVE_EXPIRY = 30.0
+# Max concurrent requests to Messenger. Extra calls queue for a free pooled
+# connection (up to MESSENGER_POOL_WAIT_SECONDS) instead of opening more
+# sockets, so a webhook flood or startup catch-up degrades into waiting.
+MESSENGER_MAX_INFLIGHT = 20
+MESSENGER_POOL_WAIT_SECONDS = 60.0
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,70 @@
+"""Minimal circuit breaker for calls to an upstream service that may be down."""
+import asyncio
+import logging
+import time
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling the upstream while its circuit is open."""
+
+    def __init__(self, name: str, retry_after: float):
+        super().__init__(f"{name} circuit open, retry in {retry_after:.1f}s")
+        self.name = name
+        self.retry_after = retry_after
+
+
+def _is_outage(exc: BaseException) -> bool:
+    """Transport failures and 5xx count against the circuit; other errors mean the upstream answered."""
+    if isinstance(exc, httpx.TransportError):
+        return True
+    return isinstance(exc, httpx.HTTPStatusError) and exc.response.status_code >= 500
+
+
+class CircuitBreaker:
+    """
+    Opens after ``fail_threshold`` consecutive outage failures and then fails
+    fast with CircuitOpenError for ``reset_after`` seconds. The first call
+    after that window is let through as a trial: success closes the circuit,
+    another outage failure reopens it.
+
+    Usage:
+        async with breaker:
+            resp = await client.get(...)
+    """
+
+    def __init__(self, name: str, fail_threshold: int = 5, reset_after: float = 30.0):
+        self.name = name
+        self.fail_threshold = fail_threshold
+        self.reset_after = reset_after
+        self._failures = 0
+        self._opened_at: float | None = None
+
+    async def __aenter__(self) -> "CircuitBreaker":
+        if self._opened_at is not None:
+            remaining = self._opened_at + self.reset_after - time.monotonic()
+            if remaining > 0:
+                raise CircuitOpenError(self.name, remaining)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        if isinstance(exc, asyncio.CancelledError):
+            return False
+        if exc is not None and _is_outage(exc):
+            self._failures += 1
+            if self._opened_at is not None or self._failures >= self.fail_threshold:
+                if self._opened_at is None:
+                    logger.warning(
+                        f"[Circuit] {self.name} opened after {self._failures} failures "
+                        f"({type(exc).__name__}); failing fast for {self.reset_after:.0f}s"
+                    )
+                self._opened_at = time.monotonic()
+        else:
+            if self._opened_at is not None:
+                logger.info(f"[Circuit] {self.name} closed")
+            self._failures = 0
+            self._opened_at = None
+        return False
@@ -27,21 +27,34 @@ _ARTIFACT_LIMIT = 10
 _ARTIFACT_MAX_BYTES = 50 * 1024 * 1024
 
 
+# Node identity fields are fixed for the process lifetime; resolve them once
+# instead of on every heartbeat. Only disk_free_gb is re-read per call.
+_node_static: dict[str, Any] | None = None
+
+
+def _node_static_fields() -> dict[str, Any]:
+    global _node_static
+    if _node_static is None:
+        _node_static = {
+            "node_name": config.NODE_NAME,
+            "role": config.CLUSTER_ROLE,
+            "ip": config.NODE_IP,
+            "api_url": getattr(config, "LLM_API_URL", ""),
+            "capabilities": config.NODE_CAPABILITIES,
+            "tags": config.NODE_TAGS,
+            "prompt_profile": getattr(config, "PROMPT_PROFILE", "slave"),
+            "heartbeat_profile": getattr(config, "HEARTBEAT_PROFILE", "slave"),
+            "skills_profile": getattr(config, "SKILLS_PROFILE", "slave"),
+            "model": config.LLM_MODEL,
+        }
+    return _node_static
+
+
 def _node_payload() -> dict[str, Any]:
     disk = shutil.disk_usage(".")
-    return {
-        "node_name": config.NODE_NAME,
-        "role": config.CLUSTER_ROLE,
-        "ip": config.NODE_IP,
-        "api_url": getattr(config, "LLM_API_URL", ""),
-        "capabilities": config.NODE_CAPABILITIES,
-        "tags": config.NODE_TAGS,
-        "prompt_profile": getattr(config, "PROMPT_PROFILE", "slave"),
-        "heartbeat_profile": getattr(config, "HEARTBEAT_PROFILE", "slave"),
-        "skills_profile": getattr(config, "SKILLS_PROFILE", "slave"),
-        "model": config.LLM_MODEL,
-        "disk_free_gb": round(disk.free / 1e9, 1),
-    }
+    payload = dict(_node_static_fields())
+    payload["disk_free_gb"] = round(disk.free / 1e9, 1)
+    return payload
 
 
 async def _register(client: httpx.AsyncClient) -> None:
@@ -24,47 +24,61 @@ MEMORY_FILE = os.path.join(config.DATA_DIR, "memory.md")
 SKILLS_DIR = str(getattr(config, "SKILLS_DIR", os.path.join(os.path.dirname(__file__), "..", "skills")))
 _PROMPT_FILE = str(getattr(config, "PROMPT_FILE", os.path.join(os.path.dirname(__file__), "..", "prompts", "PROMPT.md")))
 
+# Absolute forms shown to the model; the paths are fixed for the process.
+_ABS_DATA_DIR = os.path.abspath(config.DATA_DIR)
+_ABS_MEMORY_FILE = os.path.abspath(MEMORY_FILE)
+_ABS_SKILLS_DIR = os.path.abspath(SKILLS_DIR)
+_ABS_FILESYSTEM_MAP = os.path.abspath(os.path.join(config.DATA_DIR, "filesystem_map.md"))
+
 # ---------------------------------------------------------------------------
 # Loaders
 # ---------------------------------------------------------------------------
 
+# Cached file contents keyed on (st_mtime_ns, st_size); a hit costs one stat.
+# The size catches a memory.md append that lands within the filesystem's
+# timestamp granularity, which an mtime-only key would miss.
 _system_prompt_cache: str = ""
-_system_prompt_mtime: float | None = None
+_system_prompt_key: tuple[int, int] | None = None
 _memory_cache: str = ""
-_memory_mtime: float | None = None
+_memory_key: tuple[int, int] | None = None
+
+
+def _stat_key(path: str) -> tuple[int, int]:
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
 
 
 def load_system_prompt() -> str:
     """Return PROMPT.md content, reloading when the file changes (mtime-based)."""
-    global _system_prompt_cache, _system_prompt_mtime
+    global _system_prompt_cache, _system_prompt_key
     try:
-        mtime = os.path.getmtime(_PROMPT_FILE)
-        if _system_prompt_mtime == mtime:
+        key = _stat_key(_PROMPT_FILE)
+        if _system_prompt_key == key:
             return _system_prompt_cache
         with open(_PROMPT_FILE, "r", encoding="utf-8") as f:
             _system_prompt_cache = f.read()
-        _system_prompt_mtime = mtime
+        _system_prompt_key = key
     except FileNotFoundError as exc:
         _system_prompt_cache = ""
-        _system_prompt_mtime = None
+        _system_prompt_key = None
         raise FileNotFoundError(f"Hoonbot prompt file is missing: {_PROMPT_FILE}") from exc
     return _system_prompt_cache
 
 
 def read_memory() -> str:
     """Read the current memory file, using mtime caching to avoid repeated disk reads."""
-    global _memory_cache, _memory_mtime
+    global _memory_cache, _memory_key
     try:
-        mtime = os.path.getmtime(MEMORY_FILE)
-        if _memory_mtime == mtime:
+        key = _stat_key(MEMORY_FILE)
+        if _memory_key == key:
             return _memory_cache
         with open(MEMORY_FILE, "r", encoding="utf-8") as f:
             _memory_cache = f.read()
-        _memory_mtime = mtime
+        _memory_key = key
         return _memory_cache
     except FileNotFoundError:
         _memory_cache = ""
-        _memory_mtime = None
+        _memory_key = None
         return ""
 
 
@@ -79,8 +93,7 @@ def build_llm_context() -> str:
       - Session variables (credentials, paths, identifiers)
       - Current memory content
     """
-    context = load_system_prompt()
-    context += _build_session_variables()
+    context = _context_prefix()
     memory = read_memory()
     if memory:
         context += f"\n\n## Current Memory\n\n{memory}"
@@ -89,6 +102,31 @@ def build_llm_context() -> str:
     return context
 
 
+# (prompt file key, runtime session values) -> PROMPT.md + session variables.
+_context_prefix_cache: tuple[tuple, str] | None = None
+
+
+def _context_prefix() -> str:
+    """Return PROMPT.md plus the session-variables block.
+
+    Rebuilt only when the prompt file changes or one of the values set at
+    runtime (API key, bot id, home room, webhook URL) does; the rest of the
+    block is fixed for the process.
+    """
+    global _context_prefix_cache
+    prompt = load_system_prompt()
+    key = (
+        _system_prompt_key,
+        config.MESSENGER_API_KEY,
+        config.BOT_USER_ID,
+        config.MESSENGER_HOME_ROOM_ID,
+        getattr(config, "HOONBOT_WEBHOOK_URL", ""),
+    )
+    if _context_prefix_cache is None or _context_prefix_cache[0] != key:
+        _context_prefix_cache = (key, prompt + _build_session_variables())
+    return _context_prefix_cache[1]
+
+
 # ---------------------------------------------------------------------------
 # Per-turn ambient context
 # ---------------------------------------------------------------------------
@@ -146,8 +184,8 @@ def build_per_turn_context(profile: str = "flutter") -> str:
     cluster_role = getattr(config, "CLUSTER_ROLE", "")
     if node_name or cluster_role:
         lines.append(f"Node: {node_name or '?'} | Role: {cluster_role or '?'}")
-    lines.append(f"Data dir: {os.path.abspath(config.DATA_DIR)}")
-    lines.append(f"Memory file: {os.path.abspath(MEMORY_FILE)} ({_memory_size_summary()})")
+    lines.append(f"Data dir: {_ABS_DATA_DIR}")
+    lines.append(f"Memory file: {_ABS_MEMORY_FILE} ({_memory_size_summary()})")
     skills = _list_skills()
     if skills:
         lines.append(f"Skills available: {skills}")
@@ -180,7 +218,8 @@ def build_per_turn_context(profile: str = "flutter") -> str:
 def _build_session_variables() -> str:
     """
     All runtime values in one block — PROMPT.md references these by name.
-    Regenerated each call so live config changes (e.g. re-registration) propagate.
+    Cached by _context_prefix, keyed on the values that change at runtime, so
+    live config changes (e.g. re-registration) still propagate.
     """
     return (
         f"\n\n---\n\n## Session Variables\n\n"
@@ -193,9 +232,9 @@ def _build_session_variables() -> str:
         f"- `cluster_role`: `{getattr(config, 'CLUSTER_ROLE', 'master')}`\n"
         f"- `hoonbot_webhook_url`: `{getattr(config, 'HOONBOT_WEBHOOK_URL', '')}`\n"
         f"- `home_room_id`: `{config.MESSENGER_HOME_ROOM_ID}`\n"
-        f"- `data_dir`: `{os.path.abspath(config.DATA_DIR)}`\n"
-        f"- `memory_file`: `{os.path.abspath(MEMORY_FILE)}`\n"
-        f"- `skills_dir`: `{os.path.abspath(SKILLS_DIR)}`\n"
-        f"- `filesystem_map`: `{os.path.abspath(os.path.join(config.DATA_DIR, 'filesystem_map.md'))}`"
+        f"- `data_dir`: `{_ABS_DATA_DIR}`\n"
+        f"- `memory_file`: `{_ABS_MEMORY_FILE}`\n"
+        f"- `skills_dir`: `{_ABS_SKILLS_DIR}`\n"
+        f"- `filesystem_map`: `{_ABS_FILESYSTEM_MAP}`"
         f" (auto-updated hierarchy snapshot; read for repo/skills/config layout)\n"
     )
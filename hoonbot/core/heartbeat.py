@@ -3,7 +3,9 @@ Heartbeat — proactive background loop with orchestrator pattern.
 
 Each tick runs these phases:
   1. Planner    — LLM decomposes HEARTBEAT.md into discrete tasks with done_criteria
-  2. Executor   — each task runs through the full agent loop (with tools), one by one
+  2. Executor   — each task runs through the full agent loop (with tools), up to
+                  HEARTBEAT_MAX_CONCURRENT_TASKS at a time (default 1: concurrent
+                  tasks must be independent, as memory.md edits aren't serialized)
   3. Validator  — LLM checks which tasks didn't meet their done_criteria; retries once
   4. Summarizer — LLM synthesizes all task results into one concise TL;DR, appended
                   at the end of the report; every tick posts an "alive + summary" bubble
@@ -114,11 +116,16 @@ def _extract_checklist(text: str) -> str:
     return body.strip()
 
 
+_JSON_FENCE = re.compile(r"```(?:json)?\s*([\s\S]*?)```")
+
+
 def _extract_json(text: str, expected_type: type) -> Any:
     """Extract JSON from LLM text, handling optional ```json``` fences."""
-    m = re.search(r"```(?:json)?\s*([\s\S]*?)```", text)
-    if m:
-        text = m.group(1)
+    # Plain substring check first: most replies are bare JSON with no fence.
+    if "```" in text:
+        m = _JSON_FENCE.search(text)
+        if m:
+            text = m.group(1)
     try:
         result = json.loads(text.strip())
         if isinstance(result, expected_type):
@@ -282,6 +289,17 @@ def _assemble_report(findings: str, summary: str) -> str:
     return findings or summary_block
 
 
+async def _execute_tasks(tasks: list[dict], context: str, tick_id: str, headers: dict) -> list[str]:
+    """Run tasks through _execute_task with bounded concurrency; results keep task order."""
+    sem = asyncio.Semaphore(max(1, config.HEARTBEAT_MAX_CONCURRENT_TASKS))
+
+    async def _run_one(task: dict) -> str:
+        async with sem:
+            return await _execute_task(task, context, tick_id, headers)
+
+    return list(await asyncio.gather(*(_run_one(task) for task in tasks)))
+
+
 # ---------------------------------------------------------------------------
 # Main tick
 # ---------------------------------------------------------------------------
@@ -290,7 +308,8 @@ async def _run_once(send_fn: Callable[[int, str], Awaitable[None]]) -> None:
     """Execute one orchestrated heartbeat tick: plan → execute → validate → report."""
     global _llm_cooldown_until
 
-    loop_time = asyncio.get_event_loop().time()
+    loop = asyncio.get_running_loop()
+    loop_time = loop.time()
     if loop_time < _llm_cooldown_until:
         remaining = int(_llm_cooldown_until - loop_time)
         logger.info(f"[Heartbeat] LLM cooldown active ({remaining}s remaining) — skipping tick")
@@ -311,25 +330,24 @@ async def _run_once(send_fn: Callable[[int, str], Awaitable[None]]) -> None:
     headers = {"Authorization": f"Bearer {config.LLM_API_KEY}"}
 
     logger.info(f"[Heartbeat] Starting orchestrated tick (model={config.LLM_MODEL})")
+    await llm_api.wait_for_url_probe()
 
     full_text = ""
     try:
         # Phase 1 — Plan
         tasks = await _plan_tasks(checklist, context, headers)
 
-        # Phase 2 — Execute each task
-        results: list[str] = []
-        for task in tasks:
-            result = await _execute_task(task, context, tick_id, headers)
-            results.append(result)
+        # Phase 2 — Execute tasks (bounded concurrency, order preserved)
+        results = await _execute_tasks(tasks, context, tick_id, headers)
 
         # Phase 3 — Validate; retry incomplete tasks once
         incomplete_ids = await _validate_tasks(tasks, results, headers)
         if incomplete_ids:
             logger.info(f"[Heartbeat] Retrying {len(incomplete_ids)} incomplete task(s): {incomplete_ids}")
-            for i, task in enumerate(tasks):
-                if task.get("id") in incomplete_ids:
-                    results[i] = await _execute_task(task, context, tick_id, headers)
+            retry_idx = [i for i, task in enumerate(tasks) if task.get("id") in incomplete_ids]
+            retried = await _execute_tasks([tasks[i] for i in retry_idx], context, tick_id, headers)
+            for i, result in zip(retry_idx, retried):
+                results[i] = result
 
         # Phase 4 — Compile detailed findings (HEARTBEAT_OK results dropped)
         findings = _compile_report(results)
@@ -339,12 +357,12 @@ async def _run_once(send_fn: Callable[[int, str], Awaitable[None]]) -> None:
         full_text = _assemble_report(findings, summary)
 
     except (httpx.ConnectError, httpx.ConnectTimeout) as exc:
-        _llm_cooldown_until = asyncio.get_event_loop().time() + config.HEARTBEAT_LLM_COOLDOWN_SECONDS
+        _llm_cooldown_until = loop.time() + config.HEARTBEAT_LLM_COOLDOWN_SECONDS
         logger.warning(f"[Heartbeat] LLM unreachable ({type(exc).__name__}: {exc}). Cooling down.")
         return
     except httpx.TimeoutException as exc:
         if not full_text:
-            _llm_cooldown_until = asyncio.get_event_loop().time() + config.HEARTBEAT_LLM_COOLDOWN_SECONDS
+            _llm_cooldown_until = loop.time() + config.HEARTBEAT_LLM_COOLDOWN_SECONDS
             logger.warning(f"[Heartbeat] LLM timeout with no response. Cooling down.")
             return
         logger.warning(f"[Heartbeat] Stream timeout after partial response — using what we have")
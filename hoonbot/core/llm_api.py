@@ -1,4 +1,5 @@
 """Shared HTTP client + chat-call helpers for Hoonbot -> LLM API requests."""
+import asyncio
 import json
 import logging
 from typing import Optional
@@ -9,8 +10,21 @@ import config
 
 logger = logging.getLogger(__name__)
 
+# HTTP/2 is optional (needs the `h2` package) and httpx only negotiates it over
+# TLS via ALPN. uvicorn serves the local LLM API as HTTP/1.1, so this only
+# helps an https candidate behind an HTTP/2-capable proxy (e.g. a tunnel URL).
+try:
+    import h2  # noqa: F401
+    _HTTP2 = any(url.startswith("https://") for url in config.LLM_API_CANDIDATES)
+except ImportError:
+    _HTTP2 = False
+
 _client: Optional[httpx.AsyncClient] = None
 
+# Startup task that probes LLM_API_CANDIDATES and settles config.LLM_API_URL.
+# Until it finishes, LLM_API_URL is still the default candidate.
+_url_probe: Optional[asyncio.Task] = None
+
 # Connection went stale between requests (server restarted / keepalive dropped)
 # — safe to retry the call once on a fresh connection.
 STALE_ERRORS = (httpx.RemoteProtocolError, httpx.ReadError, httpx.WriteError)
@@ -27,15 +41,42 @@ def get_client() -> httpx.AsyncClient:
             # llm-api server degrades after many requests.
             timeout=httpx.Timeout(connect=10.0, read=1800.0, write=60.0, pool=60.0),
             trust_env=False,
+            http2=_HTTP2,
             limits=httpx.Limits(
                 max_connections=10,
                 max_keepalive_connections=5,
-                keepalive_expiry=30.0,
+                keepalive_expiry=config.HTTP_KEEPALIVE_EXPIRY,
             ),
         )
     return _client
 
 
+def set_url_probe(task: Optional[asyncio.Task]) -> None:
+    """Register the startup candidate probe that wait_for_url_probe() waits on."""
+    global _url_probe
+    _url_probe = task
+
+
+async def wait_for_url_probe() -> None:
+    """Wait for the startup candidate probe, if still running, so the next call
+    goes to the URL it picked rather than the default candidate.
+
+    Shielded: a caller being cancelled must not cancel the shared probe. If
+    the probe itself fails or is cancelled, callers fall back to the current
+    config.LLM_API_URL.
+    """
+    probe = _url_probe
+    if probe is None or probe.done():
+        return
+    try:
+        await asyncio.shield(probe)
+    except asyncio.CancelledError:
+        if not probe.cancelled():
+            raise
+    except Exception:
+        pass  # logged by the probe task's done-callback
+
+
 async def close_client() -> None:
     """Close the shared LLM API client."""
     global _client
@@ -44,6 +85,32 @@ async def close_client() -> None:
     _client = None
 
 
+async def aiter_sse_data(resp: httpx.Response):
+    """Yield the payload of each SSE ``data:`` line as bytes, stopping at [DONE].
+
+    Splits the raw byte stream directly: aiter_lines() decodes every chunk to
+    str and re-splits it, while here only the JSON payloads are ever decoded,
+    by the JSON parser itself.
+    """
+    buf = bytearray()
+    async for chunk in resp.aiter_bytes():
+        buf += chunk
+        start = 0
+        while (nl := buf.find(b"\n", start)) != -1:
+            end = nl - 1 if nl > start and buf[nl - 1] == 0x0D else nl  # drop \r
+            if buf.startswith(b"data: ", start, end):
+                data = buf[start + 6:end]
+                if data.strip() == b"[DONE]":
+                    return
+                yield data
+            start = nl + 1
+        del buf[:start]
+    if buf.startswith(b"data: "):
+        data = buf[6:].rstrip(b"\r")
+        if data.strip() != b"[DONE]":
+            yield data
+
+
 async def chat(payload: dict, headers: dict, timeout: Optional[float] = None) -> str:
     """Non-streaming /v1/chat/completions call; returns the response text."""
     kwargs: dict = {"data": {**payload, "stream": "false"}, "headers": headers}
@@ -62,7 +129,7 @@ async def stream_chat(payload: dict, headers: dict) -> str:
     Retries once on a stale keepalive connection (see STALE_ERRORS)."""
 
     async def _once() -> str:
-        buf = ""
+        parts: list[str] = []
         async with get_client().stream(
             "POST",
             f"{config.LLM_API_URL}/v1/chat/completions",
@@ -70,26 +137,21 @@ async def stream_chat(payload: dict, headers: dict) -> str:
             headers=headers,
         ) as resp:
             resp.raise_for_status()
-            async for line in resp.aiter_lines():
-                if not line.startswith("data: "):
-                    continue
-                raw = line[6:]
-                if raw.strip() == "[DONE]":
-                    break
+            async for raw in aiter_sse_data(resp):
                 try:
                     event = json.loads(raw)
-                except json.JSONDecodeError:
+                except ValueError:  # JSONDecodeError, or undecodable bytes
                     continue
                 if "tool_status" in event:
                     ts = event["tool_status"]
-                    logger.debug(f"[LLM] Tool {ts.get('tool_name')}: {ts.get('status')}")
+                    logger.debug("[LLM] Tool %s: %s", ts.get("tool_name"), ts.get("status"))
                     continue
                 choices = event.get("choices", [])
                 if choices:
                     chunk = choices[0].get("delta", {}).get("content", "")
                     if chunk:
-                        buf += chunk
-        return buf
+                        parts.append(chunk)
+        return "".join(parts)
 
     try:
         return await _once()
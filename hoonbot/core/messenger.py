@@ -1,17 +1,58 @@
 """Async client for the Huni Messenger bot API with persistent connection pool."""
+import asyncio
+import json
 import logging
 import os
 import time
+import weakref
 from typing import Optional
 
 import httpx
 import config
+from core.circuit import CircuitBreaker
 from core.retry import with_retry
 
 logger = logging.getLogger(__name__)
 
+# HTTP/2 is optional (needs the `h2` package) and httpx only negotiates it
+# over TLS via ALPN, so it only applies when MESSENGER_URL is https. The
+# bundled Messenger server is plain HTTP/1.1 and keeps using the pool.
+try:
+    import h2  # noqa: F401
+    _HTTP2 = config.MESSENGER_URL.startswith("https://")
+except ImportError:
+    _HTTP2 = False
+
+# orjson is an optional speedup for encoding request bodies and parsing
+# responses; the fallbacks produce and accept the same compact UTF-8 JSON.
+try:
+    from orjson import dumps as _dumps, loads as _loads
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def _json(resp: httpx.Response):
+    """Parse a JSON response straight from its raw bytes (no str decode)."""
+    return _loads(resp.content)
+
+
+# Pre-parsed absolute URLs for the hottest endpoints. httpx uses an absolute
+# URL as-is instead of parsing the path and joining it onto base_url per call.
+_BASE = config.MESSENGER_URL.rstrip("/")
+_SEND_MESSAGE_URL = httpx.URL(f"{_BASE}/api/send-message")
+_EDIT_MESSAGE_URL = httpx.URL(f"{_BASE}/api/edit-message")
+_TYPING_URL = httpx.URL(f"{_BASE}/api/typing")
+_STOP_TYPING_URL = httpx.URL(f"{_BASE}/api/stop-typing")
+
 # Runtime state — populated during startup
 _api_key: str = ""
+# Request headers, rebuilt only when the key changes (see set_api_key).
+# _AUTH_HEADERS omits Content-Type for multipart uploads and downloads.
+_HEADERS: dict[str, str] = {"x-api-key": "", "Content-Type": "application/json"}
+_AUTH_HEADERS: dict[str, str] = {"x-api-key": ""}
 
 # Persistent HTTP client — shared across all requests
 _client: Optional[httpx.AsyncClient] = None
@@ -27,112 +68,198 @@ _room_cache: dict[int, dict] = {}
 # seconds rather than persisting a stale member count.
 _room_cache_at: float = 0.0
 _ROOM_CACHE_TTL_SECONDS = 30.0
+# Serializes cache refreshes so a burst of webhooks for a stale or unknown
+# room triggers one /api/rooms call, not one per message.
+_room_cache_lock = asyncio.Lock()
+
+# Raw /api/rooms responses: bot_user_id -> (fetched_at, rooms). Short TTL so
+# startup, home-room resolution and cache refreshes share one round trip.
+_rooms_cache: dict[int, tuple[float, list]] = {}
+_ROOMS_TTL_SECONDS = 5.0
+
+# Pending read receipts: room_id -> message ids. mark_read() only records ids;
+# one background flush per window posts a single merged call per room.
+_pending_reads: dict[int, set[int]] = {}
+_read_flush_task: Optional[asyncio.Task] = None
+_READ_FLUSH_SECONDS = 0.1
+
+# Per-room send locks so overlapping multi-chunk replies to one room don't
+# interleave, while different rooms still send in parallel. Weak values: a
+# lock disappears once no sender holds it.
+_send_locks: "weakref.WeakValueDictionary[int, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+# Fire-and-forget calls started via spawn(). The loop only keeps weak
+# references to tasks, so hold them here until they finish.
+_background_tasks: set[asyncio.Task] = set()
 
 
 def _get_client() -> httpx.AsyncClient:
-    """Get or create the shared httpx client."""
+    """Get or create the shared httpx client.
+
+    Synchronous on purpose: there is no await between the check and the
+    assignment, so concurrent coroutines on the loop can never build two pools.
+    """
     global _client
     if _client is None or _client.is_closed:
         _client = httpx.AsyncClient(
-            timeout=httpx.Timeout(30.0, connect=10.0),
+            # Endpoints pass paths only; httpx joins them onto the parsed base.
+            base_url=config.MESSENGER_URL,
+            timeout=httpx.Timeout(30.0, connect=10.0, pool=config.MESSENGER_POOL_WAIT_SECONDS),
             trust_env=False,
-            limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
+            http2=_HTTP2,
+            # Typing, draft edits, sends and read receipts for several rooms
+            # overlap, so keep enough warm sockets. The connection cap doubles
+            # as the bulkhead for every Messenger call: past it, requests wait
+            # in the pool. The Messenger server runs with keepAliveTimeout=0
+            # (never closes idle sockets), so HTTP_KEEPALIVE_EXPIRY on our side
+            # is the effective idle limit.
+            limits=httpx.Limits(
+                max_connections=config.MESSENGER_MAX_INFLIGHT,
+                max_keepalive_connections=10,
+                keepalive_expiry=config.HTTP_KEEPALIVE_EXPIRY,
+            ),
         )
     return _client
 
 
 async def close_client() -> None:
-    """Close the shared client. Call during application shutdown."""
-    global _client
-    if _client and not _client.is_closed:
-        await _client.aclose()
-        _client = None
+    """Flush buffered read receipts, then close the shared client. Call during
+    application shutdown."""
+    global _client, _read_flush_task
+    # Post receipts now instead of after the flush window, and make sure no
+    # flush task wakes later and builds a client nobody closes.
+    task, _read_flush_task = _read_flush_task, None
+    if task is not None and not task.done():
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+    await _post_pending_reads()
+    client, _client = _client, None
+    # Detach before awaiting so a coroutine running during aclose() gets a
+    # fresh pool from _get_client() instead of the one being torn down.
+    if client and not client.is_closed:
+        await client.aclose()
+
+
+def spawn(coro) -> asyncio.Task:
+    """Run a best-effort Messenger call in the background without awaiting it."""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
 
 
 def set_api_key(key: str) -> None:
-    global _api_key, _bot_info_cache, _room_cache_at
+    global _api_key, _HEADERS, _AUTH_HEADERS, _bot_info_cache, _room_cache_at
     _api_key = key
+    _HEADERS = {"x-api-key": key, "Content-Type": "application/json"}
+    _AUTH_HEADERS = {"x-api-key": key}
     _bot_info_cache = None
     _room_cache.clear()
     _room_cache_at = 0.0
+    _rooms_cache.clear()
     config.MESSENGER_API_KEY = key
 
 
-def _headers() -> dict:
-    return {"x-api-key": _api_key, "Content-Type": "application/json"}
-
-
 # ---------------------------------------------------------------------------
 # Bot registration & webhooks
 # ---------------------------------------------------------------------------
 
+# Guards the startup calls below: during a Messenger outage, registration
+# fails fast instead of spending every retry's backoff, so startup can fall
+# back to degraded mode (see hoonbot.lifespan).
+startup_circuit = CircuitBreaker(
+    "Messenger",
+    fail_threshold=config.MESSENGER_CIRCUIT_FAIL_THRESHOLD,
+    reset_after=config.MESSENGER_CIRCUIT_RESET_SECONDS,
+)
+
+
 async def register_bot(name: str) -> str:
     """Register bot with Messenger and return its API key."""
-    client = _get_client()
-    resp = await client.post(
-        f"{config.MESSENGER_URL}/api/bots",
-        json={"name": name},
-    )
-    if resp.status_code == 409:
-        raise RuntimeError(
-            f'Messenger bot name conflict for "{name}". '
-            "A non-bot user already has this name. "
-            "Set HOONBOT_BOT_NAME to a unique bot name."
+    async with startup_circuit:
+        client = _get_client()
+        resp = await client.post(
+            "/api/bots",
+            json={"name": name},
         )
-    resp.raise_for_status()
-    data = resp.json()
-    key = data.get("apiKey") or data.get("key") or data.get("api_key", "")
-    bot_id = data.get("bot", {}).get("id") or data.get("id")
-    logger.info(f"[Messenger] Bot registered: {name} (id={bot_id})")
-    return key
+        if resp.status_code == 409:
+            raise RuntimeError(
+                f'Messenger bot name conflict for "{name}". '
+                "A non-bot user already has this name. "
+                "Set HOONBOT_BOT_NAME to a unique bot name."
+            )
+        resp.raise_for_status()
+        data = _json(resp)
+        key = data.get("apiKey") or data.get("key") or data.get("api_key", "")
+        bot_id = data.get("bot", {}).get("id") or data.get("id")
+        logger.info(f"[Messenger] Bot registered: {name} (id={bot_id})")
+        return key
 
 
 async def register_webhook(url: str, events: list) -> None:
     """Subscribe to Messenger events. Idempotent."""
-    client = _get_client()
-    resp = await client.get(
-        f"{config.MESSENGER_URL}/api/webhooks",
-        headers=_headers(),
-    )
-    if resp.status_code == 200:
-        existing = resp.json()
-        for wh in existing:
-            if wh.get("url") == url:
-                logger.info(f"[Messenger] Webhook already registered: {url}")
-                return
+    async with startup_circuit:
+        client = _get_client()
+        resp = await client.get(
+            "/api/webhooks",
+            headers=_HEADERS,
+        )
+        if resp.status_code == 401:
+            # Stale key: surface it now (the caller re-registers) rather than
+            # spending a second authenticated round trip on a POST that must fail.
+            resp.raise_for_status()
+        if resp.status_code == 200:
+            existing = _json(resp)
+            for wh in existing:
+                if wh.get("url") == url:
+                    logger.info(f"[Messenger] Webhook already registered: {url}")
+                    return
 
-    resp = await client.post(
-        f"{config.MESSENGER_URL}/api/webhooks",
-        headers=_headers(),
-        json={"url": url, "events": events},
-    )
-    resp.raise_for_status()
-    logger.info(f"[Messenger] Webhook registered: {url} for events={events}")
+        resp = await client.post(
+            "/api/webhooks",
+            headers=_HEADERS,
+            json={"url": url, "events": events},
+        )
+        resp.raise_for_status()
+        logger.info(f"[Messenger] Webhook registered: {url} for events={events}")
 
 
 # ---------------------------------------------------------------------------
 # Messages — send, edit, delete
 # ---------------------------------------------------------------------------
 
+# Replies longer than this are split on a worker thread. _split_message is
+# linear and mostly C-level rfind, so below this the thread hop costs more
+# than the split itself.
+_SPLIT_OFFLOAD_CHARS = 200_000
+
+
 def _split_message(text: str, limit: int) -> list:
     """Split text into chunks that respect paragraph and line boundaries."""
     if len(text) <= limit:
         return [text]
 
+    # Walk one offset through the text instead of re-slicing the remainder
+    # after every chunk (which copied the whole tail each time).
     chunks = []
-    while text:
-        if len(text) <= limit:
-            chunks.append(text)
+    pos = 0
+    end = len(text)
+    while pos < end:
+        if end - pos <= limit:
+            chunks.append(text[pos:])
             break
-        cut = text.rfind("\n\n", 0, limit)
+        window = pos + limit
+        cut = text.rfind("\n\n", pos, window)
         if cut == -1:
-            cut = text.rfind("\n", 0, limit)
+            cut = text.rfind("\n", pos, window)
         if cut == -1:
-            cut = text.rfind(" ", 0, limit)
+            cut = text.rfind(" ", pos, window)
         if cut == -1:
-            cut = limit
-        chunks.append(text[:cut].rstrip())
-        text = text[cut:].lstrip()
+            cut = window
+        chunks.append(text[pos:cut].rstrip())
+        pos = cut
+        while pos < end and text[pos].isspace():
+            pos += 1
     return chunks
 
 
@@ -142,12 +269,12 @@ async def _post_text_message(room_id: int, content: str, reply_to_id: int | None
     if reply_to_id:
         body["replyToId"] = reply_to_id
     resp = await client.post(
-        f"{config.MESSENGER_URL}/api/send-message",
-        headers=_headers(),
-        json=body,
+        _SEND_MESSAGE_URL,
+        headers=_HEADERS,
+        content=_dumps(body),
     )
     resp.raise_for_status()
-    return resp.json()
+    return _json(resp)
 
 
 async def send_message_once(room_id: int, content: str, reply_to_id: int | None = None) -> None:
@@ -159,13 +286,25 @@ async def send_message_once(room_id: int, content: str, reply_to_id: int | None
 
 
 async def send_message(room_id: int, content: str, reply_to_id: int | None = None) -> None:
-    """Send a message, automatically splitting if it exceeds the character limit."""
-    chunks = _split_message(content, config.MAX_MESSAGE_LENGTH)
-    for i, chunk in enumerate(chunks):
-        async def _send(c=chunk, first=(i == 0)):
-            await _post_text_message(room_id, c, reply_to_id if first else None)
+    """Send a message, automatically splitting if it exceeds the character limit.
 
-        await with_retry(_send, label="Messenger send", max_attempts=3)
+    Chunks go out one after another on purpose: Messenger orders messages by
+    arrival, so concurrent sends could reorder a long reply. A per-room lock
+    keeps two overlapping replies to the same room from interleaving.
+    """
+    if len(content) > _SPLIT_OFFLOAD_CHARS:
+        chunks = await asyncio.to_thread(_split_message, content, config.MAX_MESSAGE_LENGTH)
+    else:
+        chunks = _split_message(content, config.MAX_MESSAGE_LENGTH)
+    lock = _send_locks.get(room_id)
+    if lock is None:
+        lock = _send_locks[room_id] = asyncio.Lock()
+    async with lock:
+        for i, chunk in enumerate(chunks):
+            await with_retry(
+                _post_text_message, room_id, chunk, reply_to_id if i == 0 else None,
+                label="Messenger send", max_attempts=3,
+            )
 
 
 async def send_message_returning_id(
@@ -181,10 +320,14 @@ async def send_message_returning_id(
     try:
         async def _send():
             data = await _post_text_message(room_id, content, reply_to_id)
-            return data.get("message", {}).get("id") or data.get("id")
+            if not isinstance(data, dict):
+                raise ValueError(f"unexpected send-message response: {data!r:.100}")
+            message = data.get("message")
+            return (message.get("id") if isinstance(message, dict) else None) or data.get("id")
 
         return await with_retry(_send, label="Messenger send (id)", max_attempts=3)
-    except Exception:
+    except (httpx.HTTPError, ValueError) as exc:
+        logger.warning(f"[Messenger] Send to room {room_id} failed: {exc}")
         return None
 
 
@@ -194,15 +337,15 @@ async def edit_message(message_id: int, content: str) -> None:
         async def _edit():
             client = _get_client()
             resp = await client.post(
-                f"{config.MESSENGER_URL}/api/edit-message",
-                headers=_headers(),
-                json={"messageId": message_id, "content": content},
+                _EDIT_MESSAGE_URL,
+                headers=_HEADERS,
+                content=_dumps({"messageId": message_id, "content": content}),
             )
             resp.raise_for_status()
 
         await with_retry(_edit, label="Messenger edit", max_attempts=2)
-    except Exception:
-        pass  # Best-effort
+    except httpx.HTTPError as exc:
+        logger.debug(f"[Messenger] Edit of message {message_id} failed: {exc}")
 
 
 async def delete_message(message_id: int) -> None:
@@ -211,30 +354,54 @@ async def delete_message(message_id: int) -> None:
         async def _delete():
             client = _get_client()
             resp = await client.post(
-                f"{config.MESSENGER_URL}/api/delete-message",
-                headers=_headers(),
+                "/api/delete-message",
+                headers=_HEADERS,
                 json={"messageId": message_id},
             )
             resp.raise_for_status()
 
         await with_retry(_delete, label="Messenger delete", max_attempts=2)
-    except Exception:
-        pass  # Best-effort
+    except httpx.HTTPError as exc:
+        logger.debug(f"[Messenger] Delete of message {message_id} failed: {exc}")
 
 
 async def mark_read(room_id: int, message_ids: list) -> None:
-    """Mark messages as read (best-effort)."""
+    """Mark messages as read (best-effort, coalesced).
+
+    Ids are buffered and flushed after _READ_FLUSH_SECONDS as one request per
+    room, so a burst of incoming messages costs one call instead of one each.
+    """
+    global _read_flush_task
     if not message_ids:
         return
-    try:
-        client = _get_client()
-        await client.post(
-            f"{config.MESSENGER_URL}/api/mark-read",
-            headers=_headers(),
-            json={"roomId": room_id, "messageIds": message_ids},
-        )
-    except Exception:
-        pass
+    _pending_reads.setdefault(room_id, set()).update(message_ids)
+    if _read_flush_task is None or _read_flush_task.done():
+        _read_flush_task = asyncio.create_task(_flush_reads())
+
+
+async def _flush_reads() -> None:
+    await asyncio.sleep(_READ_FLUSH_SECONDS)
+    await _post_pending_reads()
+
+
+async def _post_pending_reads() -> None:
+    # Ids recorded while a post is in flight are picked up by the next pass.
+    while _pending_reads:
+        room_id, ids = _pending_reads.popitem()
+        try:
+            client = _get_client()
+            await client.post(
+                "/api/mark-read",
+                headers=_HEADERS,
+                json={"roomId": room_id, "messageIds": sorted(ids)},
+            )
+        except asyncio.CancelledError:
+            # Cancelled by close_client(), which posts whatever is left.
+            _pending_reads.setdefault(room_id, set()).update(ids)
+            raise
+        except Exception as exc:
+            # One room failing must not drop the rest of the batch.
+            logger.debug(f"[Messenger] mark-read for room {room_id} failed: {exc}")
 
 
 # ---------------------------------------------------------------------------
@@ -253,11 +420,11 @@ async def send_typing(room_id: int, status_text: str | None = None) -> None:
     try:
         client = _get_client()
         await client.post(
-            f"{config.MESSENGER_URL}/api/typing",
-            headers=_headers(),
-            json=body,
+            _TYPING_URL,
+            headers=_HEADERS,
+            content=_dumps(body),
         )
-    except Exception:
+    except httpx.HTTPError:
         pass  # Best-effort
 
 
@@ -265,12 +432,12 @@ async def stop_typing(room_id: int) -> None:
     try:
         client = _get_client()
         await client.post(
-            f"{config.MESSENGER_URL}/api/stop-typing",
-            headers=_headers(),
-            json={"roomId": room_id},
+            _STOP_TYPING_URL,
+            headers=_HEADERS,
+            content=_dumps({"roomId": room_id}),
         )
-    except Exception:
-        pass
+    except httpx.HTTPError:
+        pass  # Best-effort
 
 
 # ---------------------------------------------------------------------------
@@ -285,13 +452,13 @@ async def get_bot_info(refresh: bool = False) -> Optional[dict]:
     try:
         client = _get_client()
         resp = await client.get(
-            f"{config.MESSENGER_URL}/api/bots/me",
-            headers=_headers(),
+            "/api/bots/me",
+            headers=_HEADERS,
         )
         if resp.status_code == 200:
-            _bot_info_cache = resp.json()
+            _bot_info_cache = _json(resp)
             return _bot_info_cache
-    except Exception:
+    except (httpx.HTTPError, ValueError):
         pass
     return None
 
@@ -317,6 +484,10 @@ async def _reload_room_cache() -> None:
     _room_cache_at = time.monotonic()
 
 
+def _room_cache_stale() -> bool:
+    return (time.monotonic() - _room_cache_at) >= _ROOM_CACHE_TTL_SECONDS
+
+
 async def get_room_info(room_id: int) -> dict:
     """Return room metadata (name, isGroup, memberCount) for a given room ID.
 
@@ -325,9 +496,11 @@ async def get_room_info(room_id: int) -> dict:
     picked up promptly. Falls back to a synthetic entry if the room cannot be
     resolved (e.g., API unreachable, or a room the bot isn't a member of).
     """
-    stale = (time.monotonic() - _room_cache_at) >= _ROOM_CACHE_TTL_SECONDS
-    if room_id not in _room_cache or stale:
-        await _reload_room_cache()
+    if room_id not in _room_cache or _room_cache_stale():
+        async with _room_cache_lock:
+            # Another coroutine may have refreshed while we waited.
+            if room_id not in _room_cache or _room_cache_stale():
+                await _reload_room_cache()
     return _room_cache.get(room_id, {"name": str(room_id), "isGroup": False, "memberCount": 0})
 
 
@@ -361,16 +534,23 @@ async def is_bot_solo_room(room_id: int) -> bool:
 
 
 async def get_rooms(bot_user_id: int) -> list:
+    # Callers get their own list, so sorting or filtering it in place cannot
+    # corrupt the cached copy shared with other callers.
+    cached = _rooms_cache.get(bot_user_id)
+    if cached and time.monotonic() - cached[0] < _ROOMS_TTL_SECONDS:
+        return list(cached[1])
     try:
         client = _get_client()
         resp = await client.get(
-            f"{config.MESSENGER_URL}/api/rooms",
-            headers=_headers(),
+            "/api/rooms",
+            headers=_HEADERS,
             params={"userId": bot_user_id},
         )
         if resp.status_code == 200:
-            return resp.json()
-    except Exception as exc:
+            rooms = _json(resp)
+            _rooms_cache[bot_user_id] = (time.monotonic(), rooms)
+            return list(rooms)
+    except (httpx.HTTPError, ValueError) as exc:
         logger.warning(f"[Messenger] get_rooms failed: {exc}")
     return []
 
@@ -395,32 +575,44 @@ async def download_file(file_url: str) -> tuple[bytes, str] | None:
     Returns (file_bytes, filename) or None on failure.
     """
     try:
+        # httpx sends an absolute URL as-is, ignoring base_url, so only a
+        # Messenger-relative path may carry the bot's API key.
+        url = httpx.URL(file_url)
+        if not url.is_relative_url or url.host or not file_url.startswith("/"):
+            logger.warning(f"[Messenger] Refusing non-relative file URL: {file_url!r}")
+            return None
         client = _get_client()
-        full_url = f"{config.MESSENGER_URL}{file_url}"
-        resp = await client.get(full_url, headers={"x-api-key": _api_key})
+        resp = await client.get(url, headers=_AUTH_HEADERS)
         resp.raise_for_status()
         filename = file_url.rsplit("/", 1)[-1]
         return resp.content, filename
-    except Exception as e:
+    except (httpx.HTTPError, httpx.InvalidURL) as e:
         logger.warning(f"[Messenger] File download failed for {file_url}: {e}")
         return None
 
 
+def _read_file_bytes(file_path: str) -> bytes:
+    with open(file_path, "rb") as f:
+        return f.read()
+
+
 async def send_file(room_id: int, file_path: str, caption: str | None = None) -> int:
     """Upload a local file to a room. Returns message_id on success."""
     client = _get_client()
-    with open(file_path, "rb") as f:
-        data = {"roomId": str(room_id)}
-        if caption:
-            data["content"] = caption
-        resp = await client.post(
-            f"{config.MESSENGER_URL}/api/send-file",
-            headers={"x-api-key": _api_key},  # no Content-Type — httpx sets multipart boundary
-            data=data,
-            files={"file": (os.path.basename(file_path), f)},
-        )
+    # Read in a worker thread: a sync file object passed to the async client
+    # would be read on the event loop while the upload streams.
+    content = await asyncio.to_thread(_read_file_bytes, file_path)
+    data = {"roomId": str(room_id)}
+    if caption:
+        data["content"] = caption
+    resp = await client.post(
+        "/api/send-file",
+        headers=_AUTH_HEADERS,  # no Content-Type — httpx sets multipart boundary
+        data=data,
+        files={"file": (os.path.basename(file_path), content)},
+    )
     resp.raise_for_status()
-    result = resp.json()
+    result = _json(resp)
     msg_id = result.get("message", {}).get("id") or result.get("id")
     if not msg_id:
         raise ValueError("message_id missing in upload response")
@@ -437,28 +629,70 @@ async def send_base64(room_id: int, data_url: str, file_name: str | None = None,
     if caption:
         body["content"] = caption
     resp = await client.post(
-        f"{config.MESSENGER_URL}/api/send-base64",
-        headers={"x-api-key": _api_key},
+        "/api/send-base64",
+        headers=_AUTH_HEADERS,
         json=body,  # httpx sets Content-Type: application/json automatically
     )
     resp.raise_for_status()
-    result = resp.json()
+    result = _json(resp)
     msg_id = result.get("message", {}).get("id") or result.get("id")
     if not msg_id:
         raise ValueError("message_id missing in upload response")
     return msg_id
 
 
-async def get_room_messages(room_id: int, limit: int = 20) -> list:
+async def get_room_messages(room_id: int, limit: int = 20, after: Optional[int] = None) -> list:
+    params = {"limit": limit}
+    if after:
+        params["after"] = after
     try:
         client = _get_client()
         resp = await client.get(
-            f"{config.MESSENGER_URL}/api/messages/{room_id}",
-            headers=_headers(),
-            params={"limit": limit},
+            f"/api/messages/{room_id}",
+            headers=_HEADERS,
+            params=params,
         )
         if resp.status_code == 200:
-            return resp.json()
-    except Exception as exc:
+            return _json(resp)
+    except (httpx.HTTPError, ValueError) as exc:
         logger.warning(f"[Messenger] get_room_messages({room_id}) failed: {exc}")
     return []
+
+
+# Room ids per /api/messages/bulk call (the Messenger server's cap).
+BULK_MAX_ROOMS = 50
+
+
+async def get_rooms_messages_bulk(
+    room_ids: list[int],
+    limit: int = 20,
+    after: Optional[dict[int, int]] = None,
+) -> Optional[dict[int, list]]:
+    """Fetch recent messages for up to BULK_MAX_ROOMS rooms in one request.
+
+    ``after`` maps room_id -> message id; only newer messages are returned
+    for those rooms.
+
+    Returns room_id -> messages, omitting rooms the bot cannot read, or None
+    when the call fails (including Messenger builds without the endpoint) so
+    the caller can fall back to get_room_messages() per room.
+    """
+    try:
+        client = _get_client()
+        resp = await client.post(
+            "/api/messages/bulk",
+            headers=_HEADERS,
+            content=_dumps({
+                "roomIds": room_ids,
+                "limit": limit,
+                # JSON object keys must be strings.
+                "after": {str(room_id): msg_id for room_id, msg_id in (after or {}).items()},
+            }),
+        )
+        if resp.status_code == 200:
+            return {int(room_id): msgs for room_id, msgs in _json(resp).items()}
+        if resp.status_code != 404:
+            logger.warning(f"[Messenger] get_rooms_messages_bulk failed: HTTP {resp.status_code}")
+    except (httpx.HTTPError, ValueError) as exc:
+        logger.warning(f"[Messenger] get_rooms_messages_bulk failed: {exc}")
+    return None
@@ -1,6 +1,7 @@
 """Retry helper with exponential backoff for async functions."""
 import asyncio
 import logging
+import random
 from typing import Tuple, Type
 
 import httpx
@@ -17,11 +18,12 @@ RETRYABLE = (
 
 
 def _is_retryable(exc: BaseException, retryable: tuple) -> bool:
-    """Check if an exception is worth retrying (includes 5xx HTTP errors)."""
+    """Check if an exception is worth retrying (includes 429 and 5xx HTTP errors)."""
     if isinstance(exc, retryable):
         return True
-    if isinstance(exc, httpx.HTTPStatusError) and exc.response.status_code >= 500:
-        return True
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return status == 429 or status >= 500
     return False
 
 
@@ -30,13 +32,19 @@ async def with_retry(
     *args,
     max_attempts: int = 3,
     base_delay: float = 1.0,
+    max_delay: float | None = None,
+    full_jitter: bool = False,
     retryable: Tuple[Type[BaseException], ...] = RETRYABLE,
     label: str = "",
     **kwargs,
 ):
     """
     Call an async function with exponential backoff on transient failures.
-    Also retries HTTP 5xx errors.
+    Also retries HTTP 429 and 5xx errors; other 4xx responses raise at once.
+
+    ``max_delay`` caps the exponential step. With ``full_jitter`` the sleep is
+    drawn uniformly from [0, step] instead of adding a small jitter on top, which
+    spreads out many clients restarting together (e.g. after a Messenger outage).
 
     Usage:
         result = await with_retry(some_async_fn, arg1, arg2, label="LLM chat")
@@ -51,7 +59,15 @@ async def with_retry(
             last_exc = exc
             if attempt == max_attempts:
                 break
+            # Jitter spreads out retries from a burst of calls that failed
+            # together, so they don't hit the recovering server in lockstep.
             delay = base_delay * (2 ** (attempt - 1))
+            if max_delay is not None:
+                delay = min(delay, max_delay)
+            if full_jitter:
+                delay = random.uniform(0, delay)
+            else:
+                delay += random.uniform(0, delay * 0.25)
             logger.warning(
                 f"[Retry] {label or coro_fn.__name__} attempt {attempt}/{max_attempts} "
                 f"failed ({type(exc).__name__}), retrying in {delay:.1f}s"
@@ -20,10 +20,23 @@ import config
 from core import messenger
 from core.cluster_client import try_submit_from_message
 from core.context import build_llm_context, build_per_turn_context
-from core.llm_api import get_client
+from core.llm_api import aiter_sse_data, get_client, wait_for_url_probe
 
 logger = logging.getLogger(__name__)
 
+# orjson is an optional speedup for the webhook payload, the per-token SSE
+# parse and the messages form field. Its JSONDecodeError subclasses
+# json.JSONDecodeError (a ValueError), so the handlers below catch either.
+# Both encoders write int dict keys as JSON strings (orjson needs the option).
+try:
+    from orjson import OPT_NON_STR_KEYS, dumps as _orjson_dumps, loads as _json_loads
+
+    def _json_dumps(obj) -> str:
+        return _orjson_dumps(obj, option=OPT_NON_STR_KEYS).decode()
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
 _MEMORY_FLUSH_HINT = config.read_prompt("webhook/memory_flush_hint.txt")
 router = APIRouter()
 
@@ -45,6 +58,12 @@ _room_msg_count: dict[int, int] = {}
 _SESSIONS_FILE = os.path.join(config.DATA_DIR, "room_sessions.json")
 _room_sessions: dict = {}
 
+# Session writes are coalesced: mutations mark the file dirty and one write
+# per window runs on a worker thread (see _save_room_sessions).
+_SESSIONS_SAVE_DELAY_SECONDS = 1.0
+_sessions_save_handle: asyncio.TimerHandle | None = None
+_sessions_save_task: asyncio.Task | None = None
+
 # Per-room sticky goal-mode flag: {room_id: True}. Toggled by the /goal directive
 # and forwarded to the LLM API as mode="goal" on every turn while set.
 _GOAL_MODE_FILE = os.path.join(config.DATA_DIR, "room_goal_mode.json")
@@ -56,6 +75,10 @@ _room_goal_mode: dict[int, bool] = {}
 _GOAL_DIRECTIVE_RE = re.compile(r"^\s*[/@]goal\b[ \t]*(.*)$", re.IGNORECASE | re.DOTALL)
 _GOAL_OFF_WORDS = {"off", "stop", "disable", "end", "끄기", "종료"}
 
+# The bot's @mention, matched case-insensitively. The bot name is fixed for the
+# process lifetime, so the pattern is compiled once.
+_MENTION_RE = re.compile(rf"@{re.escape(config.MESSENGER_BOT_NAME)}", re.IGNORECASE)
+
 
 # ---------------------------------------------------------------------------
 # Session persistence
@@ -81,15 +104,63 @@ def _load_room_sessions() -> None:
         _room_sessions = {}
 
 
-def _save_room_sessions() -> None:
+def _write_sessions_file(text: str) -> None:
+    """Write the sessions file atomically (temp file + os.replace)."""
     try:
         os.makedirs(os.path.dirname(_SESSIONS_FILE), exist_ok=True)
-        with open(_SESSIONS_FILE, "w", encoding="utf-8") as f:
-            json.dump({str(k): v for k, v in _room_sessions.items()}, f)
+        tmp_path = f"{_SESSIONS_FILE}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, _SESSIONS_FILE)
     except Exception as e:
         logger.warning(f"[Sessions] Could not save room sessions: {e}")
 
 
+def _dump_room_sessions() -> str:
+    return _json_dumps(_room_sessions)
+
+
+def _save_room_sessions() -> None:
+    """Schedule a write of _room_sessions; repeated calls within the window share it."""
+    global _sessions_save_handle
+    if _sessions_save_handle is None:
+        _sessions_save_handle = asyncio.get_running_loop().call_later(
+            _SESSIONS_SAVE_DELAY_SECONDS, _start_sessions_save
+        )
+
+
+def _start_sessions_save() -> None:
+    global _sessions_save_handle, _sessions_save_task
+    _sessions_save_handle = None
+    if _sessions_save_task is not None and not _sessions_save_task.done():
+        # Keep writes ordered: never race an older snapshot still being written.
+        _save_room_sessions()
+        return
+    # Snapshot on the loop thread; only the file I/O moves to the worker.
+    _sessions_save_task = asyncio.create_task(
+        asyncio.to_thread(_write_sessions_file, _dump_room_sessions())
+    )
+
+
+async def flush_room_sessions() -> None:
+    """Write any pending session changes now. Call during application shutdown."""
+    global _sessions_save_handle
+    pending = False
+    # Disarm the timer before every await so it cannot fire mid-flush and
+    # start a write this function would then not wait for.
+    while True:
+        if _sessions_save_handle is not None:
+            _sessions_save_handle.cancel()
+            _sessions_save_handle = None
+            pending = True
+        task = _sessions_save_task
+        if task is None or task.done():
+            break
+        await task
+    if pending:
+        _write_sessions_file(_dump_room_sessions())
+
+
 def _get_session_id(room_id: int) -> str | None:
     """Get session_id for a room, respecting max age."""
     entry = _room_sessions.get(room_id)
@@ -100,26 +171,33 @@ def _get_session_id(room_id: int) -> str | None:
     if not session_id:
         return None
 
-    # Check session age
+    # Check session age. This runs on every message, so the ISO timestamp is
+    # parsed once per entry and the epoch kept alongside it.
     if config.SESSION_MAX_AGE_DAYS > 0:
-        try:
-            created = datetime.fromisoformat(entry["created_at"])
-            age_days = (datetime.now(timezone.utc) - created).days
+        created = entry.get("created_epoch")
+        if created is None:
+            try:
+                created = datetime.fromisoformat(entry["created_at"]).timestamp()
+                entry["created_epoch"] = created
+            except (KeyError, ValueError):
+                pass
+        if created is not None:
+            age_days = int((time.time() - created) // 86400)
             if age_days >= config.SESSION_MAX_AGE_DAYS:
                 logger.info(f"[Sessions] Room {room_id} session expired ({age_days}d old), starting fresh")
                 del _room_sessions[room_id]
                 _save_room_sessions()
                 return None
-        except (KeyError, ValueError):
-            pass
 
     return session_id
 
 
 def _set_session_id(room_id: int, session_id: str) -> None:
+    now = datetime.now(timezone.utc)
     _room_sessions[room_id] = {
         "session_id": session_id,
-        "created_at": datetime.now(timezone.utc).isoformat(),
+        "created_at": now.isoformat(),
+        "created_epoch": now.timestamp(),
     }
     _save_room_sessions()
 
@@ -160,9 +238,40 @@ _load_room_goal_mode()
 # Webhook entry point
 # ---------------------------------------------------------------------------
 
+async def _is_addressed(room_id: int, content: str) -> bool:
+    """True when the bot should answer: home room, explicit @mention, or a
+    room it shares with a single user.
+
+    Ordered cheapest first — the home room needs no text scan, and the room
+    lookup (which may hit /api/rooms) only runs when neither matched.
+    """
+    if room_id == config.MESSENGER_HOME_ROOM_ID:
+        return True
+    if _MENTION_RE.search(content):
+        return True
+    return await messenger.is_bot_solo_room(room_id)
+
+
+# Messenger serializes webhooks as {"event", "roomId", "timestamp", "data"} in
+# that order, and edit/delete payloads start with messageId. Those events only
+# get logged, so read them off the head of the body instead of decoding it —
+# every live-edit of a streamed draft fires message_edited with the full text.
+_EDIT_DELETE_HEAD_RE = re.compile(
+    rb'\{"event":"message_(edited|deleted)","roomId":(\d+|null),'
+    rb'"timestamp":"[^"]*","data":\{"messageId":(\d+)'
+)
+
+
 @router.post("/webhook")
 async def handle_webhook(request: Request):
-    payload = await request.json()
+    body = await request.body()
+    head = _EDIT_DELETE_HEAD_RE.match(body)
+    if head:
+        action, room_id, message_id = (g.decode() for g in head.groups())
+        logger.info(f"[Webhook] Message {action} in room {room_id}: id={message_id}")
+        return {"ok": True}
+
+    payload = _json_loads(body)
     event = payload.get("event")
     data = payload.get("data", {})
     room_id = payload.get("roomId")
@@ -211,11 +320,8 @@ async def handle_webhook(request: Request):
         file_url = data.get("fileUrl", "")
         if not file_url:
             logger.warning(f"[Webhook] Image message {msg_id} has no fileUrl; refusing to process as an image")
-            is_home = room_id == config.MESSENGER_HOME_ROOM_ID
-            mention_tag = f"@{config.MESSENGER_BOT_NAME}"
-            is_solo = await messenger.is_bot_solo_room(room_id) if room_id is not None else False
-            if room_id is not None and (is_home or is_solo or mention_tag.lower() in content.lower()):
-                asyncio.create_task(
+            if room_id is not None and await _is_addressed(room_id, content):
+                messenger.spawn(
                     messenger.send_message(
                         room_id,
                         "이미지 파일을 찾을 수 없어 처리할 수 없어요. 다시 업로드해주세요.",
@@ -231,11 +337,8 @@ async def handle_webhook(request: Request):
         file_url = data.get("fileUrl", "")
         if not file_url:
             logger.warning(f"[Webhook] File message {msg_id} has no fileUrl; refusing to process as a file")
-            is_home = room_id == config.MESSENGER_HOME_ROOM_ID
-            mention_tag = f"@{config.MESSENGER_BOT_NAME}"
-            is_solo = await messenger.is_bot_solo_room(room_id) if room_id is not None else False
-            if room_id is not None and (is_home or is_solo or mention_tag.lower() in content.lower()):
-                asyncio.create_task(
+            if room_id is not None and await _is_addressed(room_id, content):
+                messenger.spawn(
                     messenger.send_message(
                         room_id,
                         "파일을 찾을 수 없어 처리할 수 없어요. 다시 업로드해주세요.",
@@ -265,18 +368,13 @@ async def handle_webhook(request: Request):
     #     This covers 1-on-1 DMs and 2-member group rooms alike. Adding a third
     #     member reverts the room to @mention-only once the cache refreshes.
     # Other rooms still require an explicit @mention.
-    is_home = room_id == config.MESSENGER_HOME_ROOM_ID
-    is_solo = await messenger.is_bot_solo_room(room_id)
-    mention_tag = f"@{config.MESSENGER_BOT_NAME}"
-    if not is_home and not is_solo and mention_tag.lower() not in content.lower():
+    if not await _is_addressed(room_id, content):
         return {"ok": True}
 
     # Strip @mention
     clean_content = content
-    if not is_home:
-        clean_content = re.sub(
-            rf"@{re.escape(config.MESSENGER_BOT_NAME)}", "", content, flags=re.IGNORECASE
-        ).strip()
+    if room_id != config.MESSENGER_HOME_ROOM_ID:
+        clean_content = _MENTION_RE.sub("", content).strip()
         if not clean_content:
             if file_infos:
                 names = ", ".join(fi["name"] for fi in file_infos)
@@ -286,7 +384,7 @@ async def handle_webhook(request: Request):
 
     # Mark as read (best-effort)
     if msg_id:
-        asyncio.create_task(messenger.mark_read(room_id, [msg_id]))
+        await messenger.mark_read(room_id, [msg_id])
 
     reply_to_data = data.get("replyTo")
     _schedule_debounced(room_id, clean_content, sender_name, msg_id, file_infos, reply_to_data)
@@ -300,14 +398,28 @@ async def handle_webhook(request: Request):
 def _schedule_debounced(room_id: int, content: str, sender_name: str, msg_id: int | None = None, file_infos: list | None = None, reply_to_data: dict | None = None) -> None:
     prior_content = ""
     combined_files: list = []
+    # Keys of messages already merged into the pending turn: message ids (a
+    # redelivered webhook) and (sender, text) pairs (a client re-firing a send
+    # as a new message). Keyed by sender so two people sending the same short
+    # reply in a group room are both kept.
+    seen: set[tuple] = set()
+    text_key = ("text", sender_name, content)
+    id_key = ("id", msg_id) if msg_id else None
 
     entry = _room_debounce.get(room_id)
-    if entry and entry["task"] and not entry["task"].done():
+    if entry and (id_key in entry["seen"] or (not file_infos and text_key in entry["seen"])):
+        # It would only duplicate the pending turn, so leave the timer alone.
+        logger.info(f"[Room {room_id}] Dropped duplicate message within debounce window")
+        return
+
+    entry = _room_debounce.pop(room_id, None)
+    if entry:
         # Follow-up arrived within the debounce window, before the turn began
         # processing — merge with the still-pending content.
-        entry["task"].cancel()
+        entry["handle"].cancel()
         prior_content = entry["content"]
         combined_files = list(entry.get("files") or [])
+        seen = entry["seen"]
     else:
         # Follow-up arrived while a turn was already being processed — merge
         # with the interrupted turn's content so the earlier message isn't lost.
@@ -324,39 +436,54 @@ def _schedule_debounced(room_id: int, content: str, sender_name: str, msg_id: in
     active = _room_active_task.pop(room_id, None)
     if active and not active.done():
         active.cancel()
-    asyncio.create_task(messenger.stop_typing(room_id))
+    messenger.spawn(messenger.stop_typing(room_id))
 
     if file_infos:
         combined_files.extend(file_infos)
+    seen.add(text_key)
+    if id_key:
+        seen.add(id_key)
 
-    async def _debounce():
-        await asyncio.sleep(config.DEBOUNCE_SECONDS)
-        final = _room_debounce.pop(room_id, None)
-        if final:
-            _room_active_task[room_id] = asyncio.current_task()
-            # Stash the content now being processed so a follow-up that
-            # interrupts this turn can merge with it (see _schedule_debounced).
-            _room_inflight[room_id] = {
-                "content": final["content"],
-                "files": final.get("files") or [],
-            }
-            try:
-                await process_message(
-                    room_id, final["content"], final["sender"], final.get("msg_id"),
-                    file_infos=final.get("files"), reply_to_data=final.get("reply_to_data"),
-                )
-            finally:
-                _room_active_task.pop(room_id, None)
-                _room_inflight.pop(room_id, None)
-
+    # A plain timer rather than a sleeping task per message: a burst of
+    # follow-ups only cancels and re-arms the handle, and exactly one task is
+    # created per burst, when the window actually closes.
     _room_debounce[room_id] = {
         "content": combined,
         "sender": sender_name,
         "msg_id": msg_id,
         "files": combined_files,
         "reply_to_data": reply_to_data,
-        "task": asyncio.create_task(_debounce()),
+        "seen": seen,
+        "handle": asyncio.get_running_loop().call_later(
+            config.DEBOUNCE_SECONDS, _fire_debounced, room_id
+        ),
+    }
+
+
+def _fire_debounced(room_id: int) -> None:
+    final = _room_debounce.pop(room_id, None)
+    if not final:
+        return
+    # Stash the content now being processed so a follow-up that interrupts
+    # this turn can merge with it (see _schedule_debounced). Set here, not in
+    # the task, so a follow-up arriving before the task first runs still
+    # finds it.
+    _room_inflight[room_id] = {
+        "content": final["content"],
+        "files": final.get("files") or [],
     }
+    _room_active_task[room_id] = asyncio.create_task(_process_debounced(room_id, final))
+
+
+async def _process_debounced(room_id: int, final: dict) -> None:
+    try:
+        await process_message(
+            room_id, final["content"], final["sender"], final.get("msg_id"),
+            file_infos=final.get("files"), reply_to_data=final.get("reply_to_data"),
+        )
+    finally:
+        _room_active_task.pop(room_id, None)
+        _room_inflight.pop(room_id, None)
 
 
 # ---------------------------------------------------------------------------
@@ -378,7 +505,12 @@ async def process_message(room_id: int, content: str, sender_name: str, reply_to
     """Core message processing pipeline with structured logging and timing."""
     start = time.monotonic()
     log_prefix = f"[Room {room_id}] [{sender_name}]"
-    logger.info(f"{log_prefix} Processing: {content[:80]!r}")
+    # %-style so the slice + repr are skipped when INFO is disabled.
+    logger.info("%s Processing: %r", log_prefix, content[:80])
+
+    # Right after startup the LLM API candidate probe may still be running;
+    # without this wait the turn would go to the default candidate.
+    await wait_for_url_probe()
 
     # @stop: halt the in-flight response for this room (server-side + local task)
     if "@stop" in content.lower():
@@ -388,12 +520,12 @@ async def process_message(room_id: int, content: str, sender_name: str, reply_to
         session_id = _get_session_id(room_id)
         if session_id:
             try:
-                async with httpx.AsyncClient(timeout=10.0) as client:
-                    resp = await client.post(
-                        f"{config.LLM_API_URL}/api/chat/sessions/{session_id}/stop",
-                        headers={"Authorization": f"Bearer {config.LLM_API_KEY}"},
-                    )
-                    resp.raise_for_status()
+                resp = await get_client().post(
+                    f"{config.LLM_API_URL}/api/chat/sessions/{session_id}/stop",
+                    headers={"Authorization": f"Bearer {config.LLM_API_KEY}"},
+                    timeout=10.0,
+                )
+                resp.raise_for_status()
             except Exception as e:
                 logger.warning(f"{log_prefix} @stop request to LLM API failed: {e}")
         await messenger.stop_typing(room_id)
@@ -422,13 +554,13 @@ async def process_message(room_id: int, content: str, sender_name: str, reply_to
             return
         await messenger.send_typing(room_id, status_text="요약 중...")
         try:
-            async with httpx.AsyncClient(timeout=120.0) as client:
-                resp = await client.post(
-                    f"{config.LLM_API_URL}/api/chat/sessions/{session_id}/compact",
-                    headers={"Authorization": f"Bearer {config.LLM_API_KEY}"},
-                )
-                resp.raise_for_status()
-                data = resp.json()
+            resp = await get_client().post(
+                f"{config.LLM_API_URL}/api/chat/sessions/{session_id}/compact",
+                headers={"Authorization": f"Bearer {config.LLM_API_KEY}"},
+                timeout=120.0,
+            )
+            resp.raise_for_status()
+            data = _json_loads(resp.content)
             if data.get("success"):
                 orig = data["original_count"]
                 new = data["new_count"]
@@ -497,12 +629,14 @@ async def process_message(room_id: int, content: str, sender_name: str, reply_to
         # Download attached files from Messenger
         downloaded_files: list[tuple[str, bytes]] = []
         if file_infos:
-            for fi in file_infos:
-                result = await messenger.download_file(fi["url"])
+            # Independent round trips — fetch all attachments concurrently.
+            # download_file returns None on HTTP/URL failures instead of raising.
+            results = await asyncio.gather(*(messenger.download_file(fi["url"]) for fi in file_infos))
+            for fi, result in zip(file_infos, results):
                 if result:
                     file_bytes, filename = result
                     downloaded_files.append((fi["name"], file_bytes))
-                    logger.info(f"{log_prefix} Downloaded file: {fi['name']} ({len(file_bytes)} bytes)")
+                    logger.info("%s Downloaded file: %s (%d bytes)", log_prefix, fi["name"], len(file_bytes))
                 else:
                     logger.warning(f"{log_prefix} Failed to download: {fi['name']}")
 
@@ -527,7 +661,7 @@ async def process_message(room_id: int, content: str, sender_name: str, reply_to
             messages = [{"role": "user", "content": user_content}]
             llm_data = {
                 "model": config.LLM_MODEL,
-                "messages": json.dumps(messages),
+                "messages": messages,
                 "session_id": existing_session_id,
             }
             logger.info(f"{log_prefix} Continuing session {existing_session_id} (msg #{count})")
@@ -536,14 +670,16 @@ async def process_message(room_id: int, content: str, sender_name: str, reply_to
             # (PROMPT.md + session vars + memory) as a system message so it
             # lands in history once and doesn't bloat every subsequent user turn.
             _room_msg_count[room_id] = 0
-            context = build_llm_context()
+            # New sessions may (re)read PROMPT.md and memory.md, which can be
+            # large — keep that off the loop so other rooms aren't stalled.
+            context = await asyncio.to_thread(build_llm_context)
             messages = [
                 {"role": "system", "content": context},
                 {"role": "user", "content": user_content},
             ]
             llm_data = {
                 "model": config.LLM_MODEL,
-                "messages": json.dumps(messages),
+                "messages": messages,
             }
             logger.info(f"{log_prefix} Starting new session")
 
@@ -568,13 +704,13 @@ async def process_message(room_id: int, content: str, sender_name: str, reply_to
             return
 
         elapsed = time.monotonic() - start
-        logger.info(f"{log_prefix} Completed in {elapsed:.1f}s, reply={len(reply)} chars")
+        logger.info("%s Completed in %.1fs, reply=%d chars", log_prefix, elapsed, len(reply))
 
     except Exception as exc:
         elapsed = time.monotonic() - start
         logger.error(f"{log_prefix} Failed after {elapsed:.1f}s: {exc}", exc_info=True)
         try:
-            if "Connect" in type(exc).__name__ or "Timeout" in type(exc).__name__:
+            if isinstance(exc, (httpx.ConnectError, httpx.TimeoutException)):
                 user_msg = "LLM 서버에 연결할 수 없어요. 잠시 후 다시 시도해주세요."
             else:
                 user_msg = f"오류: {str(exc)[:100]}"
@@ -585,6 +721,28 @@ async def process_message(room_id: int, content: str, sender_name: str, reply_to
         await messenger.stop_typing(room_id)
 
 
+def _llm_request_kwargs(llm_data: dict, headers: dict, downloaded_files: list[tuple[str, bytes]] | None) -> dict:
+    """httpx kwargs for a /v1/chat/completions call.
+
+    Plain turns go out as one JSON body. The LLM API only accepts uploads as
+    multipart form data, so turns with attachments keep the form encoding,
+    with messages as a JSON-string field.
+    """
+    if not downloaded_files:
+        return {
+            "content": _json_dumps(llm_data),
+            "headers": {**headers, "Content-Type": "application/json"},
+        }
+    form = {**llm_data, "messages": _json_dumps(llm_data["messages"])}
+    if "stream" in form:
+        form["stream"] = "true" if form["stream"] else "false"
+    return {
+        "data": form,
+        "files": [("files", (name, data, "application/octet-stream")) for name, data in downloaded_files],
+        "headers": headers,
+    }
+
+
 async def _save_session_from_response(room_id: int, result: dict, existing_session_id: str | None, log_prefix: str) -> None:
     """Save session_id returned by LLM API."""
     returned_session_id = result.get("x_session_id")
@@ -599,13 +757,10 @@ async def _save_session_from_response(room_id: int, result: dict, existing_sessi
 
 async def _process_sync(room_id: int, llm_data: dict, headers: dict, existing_session_id: str | None, log_prefix: str, reply_to_id: int | None, downloaded_files: list[tuple[str, bytes]] | None = None) -> str | None:
     """Send request, wait for full response, send to Messenger."""
-    files_payload = [("files", (name, data, "application/octet-stream")) for name, data in (downloaded_files or [])]
     client = get_client()
     response = await client.post(
         f"{config.LLM_API_URL}/v1/chat/completions",
-        data=llm_data,
-        files=files_payload or None,
-        headers=headers,
+        **_llm_request_kwargs(llm_data, headers, downloaded_files),
     )
 
     if response.status_code in (404, 500) and existing_session_id:
@@ -616,7 +771,7 @@ async def _process_sync(room_id: int, llm_data: dict, headers: dict, existing_se
         return None
 
     response.raise_for_status()
-    result = response.json()
+    result = _json_loads(response.content)
 
     await _save_session_from_response(room_id, result, existing_session_id, log_prefix)
     reply = result["choices"][0]["message"]["content"]
@@ -688,8 +843,7 @@ async def _process_streaming(room_id: int, llm_data: dict, headers: dict, existi
         `_TYPING_REFRESH_INTERVAL_SECONDS` so the indicator survives long
         tool calls (Messenger auto-clears at 15s / client at 20s).
     """
-    llm_data["stream"] = "true"
-    files_payload = [("files", (name, data, "application/octet-stream")) for name, data in (downloaded_files or [])]
+    llm_data["stream"] = True
 
     full_text = ""
     # Character offset in full_text at the last tool event. Text streamed after
@@ -759,9 +913,7 @@ async def _process_streaming(room_id: int, llm_data: dict, headers: dict, existi
         async with client.stream(
             "POST",
             f"{config.LLM_API_URL}/v1/chat/completions",
-            data=llm_data,
-            files=files_payload or None,
-            headers=headers,
+            **_llm_request_kwargs(llm_data, headers, downloaded_files),
         ) as response:
             if response.status_code in (404, 500) and existing_session_id:
                 logger.warning(f"{log_prefix} Session {existing_session_id} got {response.status_code}, starting fresh")
@@ -773,16 +925,10 @@ async def _process_streaming(room_id: int, llm_data: dict, headers: dict, existi
             response.raise_for_status()
             session_id_from_header = response.headers.get("x-session-id")
 
-            async for line in response.aiter_lines():
-                if not line.startswith("data: "):
-                    continue
-                data_str = line[6:]
-                if data_str.strip() == "[DONE]":
-                    break
-
+            async for data in aiter_sse_data(response):
                 try:
-                    event = json.loads(data_str)
-                except json.JSONDecodeError:
+                    event = _json_loads(data)
+                except ValueError:  # JSONDecodeError, or undecodable bytes
                     continue
 
                 if "error" in event:
@@ -817,19 +963,21 @@ async def _process_streaming(room_id: int, llm_data: dict, headers: dict, existi
                 text = choices[0].get("delta", {}).get("content", "")
                 if text:
                     full_text += text
-                    stripped = full_text.strip()
-                    if stripped:
-                        now = time.monotonic()
-                        if not first_sent:
+                    # Strip only when a draft update is actually due: stripping
+                    # the whole reply on every token made the stream quadratic.
+                    now = time.monotonic()
+                    if not first_sent:
+                        stripped = full_text.strip()
+                        if stripped:
                             # First visible content — show it immediately, no
                             # interval gate, so the bubble appears the instant
                             # generation starts instead of up to one interval late.
                             first_sent = True
                             last_draft_edit = now
                             _schedule_flush(stripped)
-                        elif now - last_draft_edit >= _DRAFT_EDIT_INTERVAL_SECONDS:
-                            last_draft_edit = now
-                            _schedule_flush(stripped)
+                    elif now - last_draft_edit >= _DRAFT_EDIT_INTERVAL_SECONDS:
+                        last_draft_edit = now
+                        _schedule_flush(full_text.strip())
 
     except httpx.ReadTimeout:
         logger.warning(f"{log_prefix} Stream read timeout after collecting {len(full_text)} chars")
@@ -931,7 +1079,7 @@ async def handle_incoming_webhook(path: str, request: Request):
             raise HTTPException(status_code=401, detail="Invalid webhook secret")
 
     try:
-        payload = await request.json()
+        payload = _json_loads(await request.body())
     except Exception:
         payload = {}
 
@@ -11,9 +11,11 @@ Startup sequence:
 7. Serve FastAPI on HOONBOT_PORT
 """
 import asyncio
+import json
 import logging
 import os
 from contextlib import asynccontextmanager
+from pathlib import Path
 
 import httpx
 import uvicorn
@@ -21,11 +23,12 @@ from fastapi import FastAPI
 
 import config
 from core import messenger
+from core.circuit import CircuitOpenError
 from core.heartbeat import run_heartbeat_loop
-from core.llm_api import close_client as close_llm_client
+from core.llm_api import close_client as close_llm_client, get_client as get_llm_client, set_url_probe
 from core.retry import with_retry
 from handlers.health import router as health_router
-from handlers.webhook import router as webhook_router, process_message
+from handlers.webhook import router as webhook_router, process_message, flush_room_sessions
 
 logging.basicConfig(
     level=logging.INFO,
@@ -33,8 +36,18 @@ logging.basicConfig(
 )
 logger = logging.getLogger("hoonbot")
 
-_KEY_FILE = os.path.join(os.path.dirname(__file__), "data", ".apikey")
+# lifespan() creates config.DATA_DIR before anything below is written.
+_DATA_DIR = Path(config.DATA_DIR)
+_KEY_FILE = _DATA_DIR / ".apikey"
+# Catch-up watermarks: room_id -> newest message id already scanned. Startup
+# catch-up only fetches messages after it, so quiet rooms cost nothing.
+_WATERMARK_FILE = _DATA_DIR / ".last_seen"
 _WEBHOOK_EVENTS = ["new_message", "message_edited", "message_deleted"]
+# Catch-up bounds: room history fetches are cheap Messenger GETs; replaying a
+# missed message is a full LLM turn, so far fewer of those run at once. The
+# fetch bound stays well under config.MESSENGER_MAX_INFLIGHT so live webhook
+# traffic still gets connections during catch-up.
+_CATCHUP_FETCH_CONCURRENCY = 8
 _CATCHUP_MAX_CONCURRENCY = 3
 
 
@@ -42,18 +55,44 @@ _CATCHUP_MAX_CONCURRENCY = 3
 # Helpers
 # ---------------------------------------------------------------------------
 
+_cached_key: str | None = None
+
+
 def _load_saved_key() -> str:
+    global _cached_key
+    if _cached_key is None:
+        try:
+            _cached_key = _KEY_FILE.read_text().strip()
+        except FileNotFoundError:
+            _cached_key = ""
+    return _cached_key
+
+
+def _save_key(key: str) -> None:
+    """Write the key via a temp file + rename so a crash never leaves it truncated."""
+    global _cached_key
+    tmp_path = _KEY_FILE.with_name(_KEY_FILE.name + ".tmp")
+    tmp_path.write_text(key)
+    tmp_path.replace(_KEY_FILE)
+    _cached_key = key
+
+
+def _load_watermarks() -> dict[int, int]:
     try:
-        with open(_KEY_FILE) as f:
-            return f.read().strip()
+        raw = json.loads(_WATERMARK_FILE.read_text())
+        return {int(room_id): int(msg_id) for room_id, msg_id in raw.items()}
     except FileNotFoundError:
-        return ""
+        return {}
+    except (ValueError, TypeError, AttributeError) as exc:
+        logger.warning(f"[CatchUp] Ignoring unreadable watermark file: {exc}")
+        return {}
 
 
-def _save_key(key: str) -> None:
-    os.makedirs(os.path.dirname(_KEY_FILE), exist_ok=True)
-    with open(_KEY_FILE, "w") as f:
-        f.write(key)
+def _save_watermarks(watermarks: dict[int, int]) -> None:
+    """Write watermarks via a temp file + rename, like _save_key."""
+    tmp_path = _WATERMARK_FILE.with_name(_WATERMARK_FILE.name + ".tmp")
+    tmp_path.write_text(json.dumps({str(room_id): msg_id for room_id, msg_id in watermarks.items()}))
+    tmp_path.replace(_WATERMARK_FILE)
 
 
 # ---------------------------------------------------------------------------
@@ -78,8 +117,10 @@ async def _autofind_llm_api() -> None:
     candidates = config.LLM_API_CANDIDATES
     logger.info(f"[Health] Probing LLM API candidates: {candidates}")
 
-    async with httpx.AsyncClient() as client:
-        results = await asyncio.gather(*(_probe_llm_url(client, url) for url in candidates))
+    # Probe through the shared LLM API client: the winning candidate's
+    # connection is then already warm in the pool for the first real call.
+    client = get_llm_client()
+    results = await asyncio.gather(*(_probe_llm_url(client, url) for url in candidates))
 
     reachable = {r for r in results if r}
     for url in candidates:  # honour priority order
@@ -107,6 +148,8 @@ async def _register_bot() -> None:
             config.MESSENGER_BOT_NAME,
             max_attempts=config.STARTUP_RETRY_ATTEMPTS,
             base_delay=config.STARTUP_RETRY_DELAY,
+            max_delay=config.STARTUP_RETRY_MAX_DELAY,
+            full_jitter=True,
             label="Messenger bot registration",
         )
         messenger.set_api_key(key)
@@ -129,13 +172,17 @@ async def _subscribe_webhooks() -> None:
     webhook_url = config.HOONBOT_WEBHOOK_URL
     logger.info(f"[Messenger] Webhook target: {webhook_url}")
 
-    retries = config.STARTUP_RETRY_ATTEMPTS
-    delay = config.STARTUP_RETRY_DELAY
+    backoff = dict(
+        max_attempts=config.STARTUP_RETRY_ATTEMPTS,
+        base_delay=config.STARTUP_RETRY_DELAY,
+        max_delay=config.STARTUP_RETRY_MAX_DELAY,
+        full_jitter=True,
+    )
 
     try:
         await with_retry(
             messenger.register_webhook, webhook_url, _WEBHOOK_EVENTS,
-            max_attempts=retries, base_delay=delay,
+            **backoff,
             label="Messenger webhook registration",
         )
         return
@@ -147,7 +194,7 @@ async def _subscribe_webhooks() -> None:
     logger.warning("[Messenger] API key unauthorized, re-registering bot")
     key = await with_retry(
         messenger.register_bot, config.MESSENGER_BOT_NAME,
-        max_attempts=retries, base_delay=delay,
+        **backoff,
         label="Messenger bot registration",
     )
     messenger.set_api_key(key)
@@ -156,7 +203,7 @@ async def _subscribe_webhooks() -> None:
 
     await with_retry(
         messenger.register_webhook, webhook_url, _WEBHOOK_EVENTS,
-        max_attempts=retries, base_delay=delay,
+        **backoff,
         label="Messenger webhook registration (after key refresh)",
     )
 
@@ -195,45 +242,115 @@ async def _resolve_home_room() -> None:
     return
 
 
-async def _catch_up_room(room: dict, semaphore: asyncio.Semaphore) -> None:
-    async with semaphore:
-        room_id = room["id"]
-        messages = await messenger.get_room_messages(room_id, limit=config.CATCHUP_MESSAGE_LIMIT)
-        if not messages:
-            return
-
-        # Find the last human text message
-        last_human_idx = -1
-        for i, msg in enumerate(messages):
-            if (
-                msg.get("senderName") != config.MESSENGER_BOT_NAME
-                and not msg.get("isBot")
-                and msg.get("type") == "text"
-                and msg.get("content", "").strip()
-            ):
-                last_human_idx = i
-
-        if last_human_idx == -1:
-            return
+async def _fetch_catch_up_history(
+    room_ids: list[int],
+    watermarks: dict[int, int],
+    fetch_sem: asyncio.Semaphore,
+) -> dict[int, list]:
+    """Prefetch recent history for many rooms through the Messenger bulk endpoint."""
+    async def fetch_batch(batch: list[int]) -> dict[int, list] | None:
+        after = {room_id: watermarks[room_id] for room_id in batch if room_id in watermarks}
+        async with fetch_sem:
+            return await messenger.get_rooms_messages_bulk(
+                batch, limit=config.CATCHUP_MESSAGE_LIMIT, after=after,
+            )
+
+    size = messenger.BULK_MAX_ROOMS
+    chunks = [room_ids[i:i + size] for i in range(0, len(room_ids), size)]
+    batches = await asyncio.gather(*(fetch_batch(chunk) for chunk in chunks))
+    history: dict[int, list] = {}
+    for chunk, batch in zip(chunks, batches):
+        if batch is not None:
+            # Rooms the server left out have nothing the bot can read.
+            history.update({room_id: batch.get(room_id, []) for room_id in chunk})
+    return history
+
+
+async def _setup_messenger() -> None:
+    """Register with Messenger, subscribe webhooks, and resolve bot identity + home room."""
+    await _register_bot()
+    # Webhook subscription may replace a stale key, so it runs before the
+    # calls that need a valid one; those two are independent of each other.
+    await _subscribe_webhooks()
+    await asyncio.gather(_fetch_bot_identity(), _resolve_home_room())
 
-        # Skip if Hoonbot already replied after that message
-        already_replied = any(
-            msg.get("senderName") == config.MESSENGER_BOT_NAME
-            for msg in messages[last_human_idx + 1:]
-        )
-        if already_replied:
-            return
 
-        missed = messages[last_human_idx]
-        content = missed.get("content", "").strip()
-        sender = missed.get("senderName", "unknown")
-        msg_id = missed.get("id")
-        logger.info(f"[CatchUp] Room {room_id}: missed msg from {sender!r}: {content[:50]!r}")
+async def _recover_messenger() -> None:
+    """Degraded mode: retry Messenger setup until it succeeds, then run the skipped catch-up."""
+    while True:
+        try:
+            await _setup_messenger()
+            break
+        except CircuitOpenError as exc:
+            await asyncio.sleep(exc.retry_after)
+        except Exception as exc:
+            # Messenger answered but setup still failed (retries exhausted on
+            # 429/5xx, bad JSON, a 409 on register): keep trying at the
+            # breaker's pace rather than staying degraded until a restart.
+            logger.error(
+                f"[Messenger] Setup failed ({type(exc).__name__}: {exc}); "
+                f"retrying in {config.MESSENGER_CIRCUIT_RESET_SECONDS:.0f}s"
+            )
+            await asyncio.sleep(config.MESSENGER_CIRCUIT_RESET_SECONDS)
+    logger.info("[Messenger] Setup complete, leaving degraded mode")
+    await _catch_up()
+
+
+async def _catch_up_room(
+    room: dict,
+    history: dict[int, list],
+    watermark: int | None,
+    fetch_sem: asyncio.Semaphore,
+    process_sem: asyncio.Semaphore,
+) -> int | None:
+    """Replay the room's missed message, if any; return its new watermark."""
+    room_id = room["id"]
+    messages = history.get(room_id)
+    if messages is None:
+        # Not covered by the bulk prefetch (older Messenger or a failed batch).
+        # Only the fetch holds fetch_sem, so rooms with nothing to replay are
+        # scanned without waiting behind other rooms' LLM turns.
+        async with fetch_sem:
+            messages = await messenger.get_room_messages(
+                room_id, limit=config.CATCHUP_MESSAGE_LIMIT, after=watermark,
+            )
+    if not messages:
+        return None
+    newest_id = messages[-1].get("id")
+
+    # Walk back from the newest message to the last human text message,
+    # noting whether Hoonbot replied after it (then nothing was missed).
+    bot_name = config.MESSENGER_BOT_NAME
+    missed = None
+    replied = False
+    for msg in reversed(messages):
+        if msg.get("senderName") == bot_name:
+            replied = True
+            continue
+        if msg.get("isBot") or msg.get("type") != "text":
+            continue
+        content = (msg.get("content") or "").strip()
+        if content:
+            if not replied:
+                missed = msg
+            break
+
+    if missed is None:
+        return newest_id
+
+    sender = missed.get("senderName", "unknown")
+    msg_id = missed.get("id")
+    logger.info(f"[CatchUp] Room {room_id}: missed msg from {sender!r}: {content[:50]!r}")
+    async with process_sem:
         await process_message(room_id, content, sender, msg_id)
+    # Only advanced once the replay finished, so a crash mid-reply retries it.
+    return newest_id
 
 
 async def _catch_up() -> None:
     """Process the last unanswered human message in each room (handles offline period)."""
+    # Bot info and rooms were just fetched (and cached) by startup; the room
+    # and history scan only needs Messenger, so it overlaps the LLM API probe.
     bot_info = await messenger.get_bot_info()
     if not bot_info:
         logger.warning("[CatchUp] Could not get bot info, skipping")
@@ -244,14 +361,26 @@ async def _catch_up() -> None:
     if not rooms:
         return
 
-    semaphore = asyncio.Semaphore(_CATCHUP_MAX_CONCURRENCY)
+    fetch_sem = asyncio.Semaphore(_CATCHUP_FETCH_CONCURRENCY)
+    process_sem = asyncio.Semaphore(_CATCHUP_MAX_CONCURRENCY)
+    watermarks = _load_watermarks()
+    history = await _fetch_catch_up_history([room["id"] for room in rooms], watermarks, fetch_sem)
     results = await asyncio.gather(
-        *(_catch_up_room(room, semaphore) for room in rooms),
+        *(
+            _catch_up_room(room, history, watermarks.get(room["id"]), fetch_sem, process_sem)
+            for room in rooms
+        ),
         return_exceptions=True,
     )
-    for result in results:
+    updated = False
+    for room, result in zip(rooms, results):
         if isinstance(result, Exception):
             logger.error(f"[CatchUp] Room catch-up failed: {result}", exc_info=result)
+        elif isinstance(result, int) and result != watermarks.get(room["id"]):
+            watermarks[room["id"]] = result
+            updated = True
+    if updated:
+        _save_watermarks(watermarks)
 
 # ---------------------------------------------------------------------------
 # Application lifespan
@@ -275,11 +404,19 @@ async def lifespan(app: FastAPI):
             logger.info("[Hoonbot] Slave shutdown complete")
         return
 
-    await _autofind_llm_api()
-    await _register_bot()
-    await _fetch_bot_identity()
-    await _subscribe_webhooks()
-    await _resolve_home_room()
+    # The LLM API probe only matters once a message reaches the LLM, so it runs
+    # behind Messenger registration instead of delaying startup by its timeout.
+    # process_message and the heartbeat wait on it (wait_for_url_probe) before
+    # their first LLM call.
+    llm_probe_task = asyncio.create_task(_autofind_llm_api())
+    set_url_probe(llm_probe_task)
+    try:
+        await _setup_messenger()
+        messenger_ready = True
+    except CircuitOpenError:
+        # Messenger is down hard: serve anyway and finish setup in the background.
+        logger.warning("[Messenger] Unreachable, starting in degraded mode; setup retries in the background")
+        messenger_ready = False
 
     logger.info(f"[Hoonbot] Ready on port {config.HOONBOT_PORT}")
     logger.info(
@@ -288,7 +425,10 @@ async def lifespan(app: FastAPI):
         f"Debounce={config.DEBOUNCE_SECONDS}s"
     )
 
-    catchup_task = asyncio.create_task(_catch_up())
+    if messenger_ready:
+        catchup_task = asyncio.create_task(_catch_up())
+    else:
+        catchup_task = asyncio.create_task(_recover_messenger())
     heartbeat_task = asyncio.create_task(run_heartbeat_loop(messenger.send_message_once))
 
     # Relay finished cluster task results back to the rooms that requested them.
@@ -302,16 +442,19 @@ async def lifespan(app: FastAPI):
         elif exc := task.exception():
             logger.error(f"[Hoonbot] Background task '{name}' died: {exc}", exc_info=exc)
 
+    llm_probe_task.add_done_callback(lambda t: _on_task_done(t, "llm_probe"))
     catchup_task.add_done_callback(lambda t: _on_task_done(t, "catch_up"))
     heartbeat_task.add_done_callback(lambda t: _on_task_done(t, "heartbeat"))
     relay_task.add_done_callback(lambda t: _on_task_done(t, "cluster_relay"))
 
     yield
 
+    llm_probe_task.cancel()
     catchup_task.cancel()
     heartbeat_task.cancel()
     relay_task.cancel()
-    await asyncio.gather(catchup_task, heartbeat_task, relay_task, return_exceptions=True)
+    await asyncio.gather(llm_probe_task, catchup_task, heartbeat_task, relay_task, return_exceptions=True)
+    await flush_room_sessions()
     await close_llm_client()
     await messenger.close_client()
     logger.info("[Hoonbot] Shutdown complete")
@@ -323,6 +466,10 @@ app.include_router(webhook_router)
 
 
 if __name__ == "__main__":
+    # uvicorn's default loop="auto"/http="auto" picks uvloop and httptools
+    # (installed by uvicorn[standard]) and falls back to asyncio/h11 where they
+    # are unavailable, e.g. uvloop on Windows. Single worker on purpose: debounce
+    # state, session ids, catch-up and the heartbeat loop are per-process.
     uvicorn.run(
         "hoonbot:app",
         host=config.HOONBOT_HOST,
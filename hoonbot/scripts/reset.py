@@ -14,31 +14,32 @@ Usage:
     python reset.py --view-memory      # View memory.md content (read-only)
 """
 import argparse
-import os
 import sys
+from pathlib import Path
 
-DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
-MEMORY_FILE = os.path.join(DATA_DIR, "memory.md")
+# This script lives in hoonbot/scripts/; the data directory is hoonbot/data/.
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+MEMORY_FILE = DATA_DIR / "memory.md"
 
 
 def view_memory():
-    if not os.path.exists(MEMORY_FILE):
+    try:
+        content = MEMORY_FILE.read_text(encoding="utf-8")
+    except FileNotFoundError:
         print("No memory file found.")
         return
-    with open(MEMORY_FILE, "r", encoding="utf-8") as f:
-        content = f.read()
     print("\n=== Memory.md ===\n")
     print(content)
     print("\n=== End Memory ===\n")
 
 
 def reset_memory():
-    if os.path.exists(MEMORY_FILE):
-        os.remove(MEMORY_FILE)
-    # Recreate with default template
-    os.makedirs(DATA_DIR, exist_ok=True)
-    with open(MEMORY_FILE, "w", encoding="utf-8") as f:
-        f.write("# Hoonbot Memory\n\nThis file stores persistent information about the user, projects, and preferences.\n\n")
+    # Overwriting with the default template replaces the old content.
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    MEMORY_FILE.write_text(
+        "# Hoonbot Memory\n\nThis file stores persistent information about the user, projects, and preferences.\n\n",
+        encoding="utf-8",
+    )
     print("Memory reset to default template.")
 
 
@@ -6,28 +6,29 @@ Automatically obtains LLM_API_KEY from LLM_API_fast and sets up environment vari
 """
 import sys
 import os
+from pathlib import Path
 
-# Fix Windows encoding issues
-if sys.platform == 'win32':
+# Fix Windows encoding issues (already UTF-8 under PYTHONUTF8 / UTF-8 mode)
+if sys.platform == 'win32' and (sys.stdout.encoding or '').lower() != 'utf-8':
     import io
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
 
 import httpx
 
-SCRIPT_DIR = os.path.dirname(__file__)
-PROJECT_DIR = os.path.dirname(SCRIPT_DIR)
+SCRIPT_DIR = Path(__file__).resolve().parent
+PROJECT_DIR = SCRIPT_DIR.parent
+DATA_DIR = PROJECT_DIR / "data"
 
 
-def get_llm_api_token(llm_url: str, username: str, password: str) -> str | None:
+def get_llm_api_token(client: httpx.Client, llm_url: str, username: str, password: str) -> str | None:
     """Get access token from LLM_API_fast."""
     print(f"\n[Setup] Connecting to LLM_API_fast at {llm_url}")
 
     try:
-        response = httpx.post(
+        response = client.post(
             f"{llm_url}/api/auth/login",
             json={"username": username, "password": password},
-            timeout=10.0
         )
         response.raise_for_status()
         result = response.json()
@@ -54,13 +55,12 @@ def get_llm_api_token(llm_url: str, username: str, password: str) -> str | None:
         return None
 
 
-def get_available_models(llm_url: str, token: str) -> list | None:
+def get_available_models(client: httpx.Client, llm_url: str, token: str) -> list | None:
     """Get list of available models."""
     try:
-        response = httpx.get(
+        response = client.get(
             f"{llm_url}/v1/models",
             headers={"Authorization": f"Bearer {token}"},
-            timeout=10.0
         )
         response.raise_for_status()
         result = response.json()
@@ -84,22 +84,24 @@ def set_env_var(name: str, value: str) -> bool:
         return False
 
 
+def _write_atomic(path: Path, text: str) -> None:
+    """Write text via a temp file + rename so an interrupted write never leaves a truncated file."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(text)
+    tmp_path.replace(path)
+
+
 def save_llm_credentials(llm_key: str, llm_model: str) -> bool:
     """Save LLM credentials to data/.llm_key and data/.llm_model files."""
-    data_dir = os.path.join(PROJECT_DIR, "data")
-    os.makedirs(data_dir, exist_ok=True)
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
 
     try:
         # Save API key
-        key_file = os.path.join(data_dir, ".llm_key")
-        with open(key_file, "w") as f:
-            f.write(llm_key)
+        _write_atomic(DATA_DIR / ".llm_key", llm_key)
         print(f"[OK] Saved LLM_API_KEY to data/.llm_key")
 
         # Save model name
-        model_file = os.path.join(data_dir, ".llm_model")
-        with open(model_file, "w") as f:
-            f.write(llm_model)
+        _write_atomic(DATA_DIR / ".llm_model", llm_model)
         print(f"[OK] Saved LLM_MODEL to data/.llm_model")
 
         return True
@@ -115,7 +117,7 @@ def main():
 
     # Import config from the hoonbot project root.
     import sys as _sys
-    _sys.path.insert(0, PROJECT_DIR)
+    _sys.path.insert(0, str(PROJECT_DIR))
     import config as _cfg
 
     # LLM_API_fast URL. config.LLM_API_URL already applies this priority:
@@ -126,19 +128,21 @@ def main():
     print(f"\nLLM_API_fast URL: {llm_url}")
     print(f"Username: {username}")
 
-    # Get token
-    print("\nAttempting to login to LLM_API_fast...")
-    token = get_llm_api_token(llm_url, username, password)
-
-    if not token:
-        print("\n[Setup] Could not obtain LLM_API_KEY automatically.")
-        print("        You'll need to set it manually:")
-        print("        export LLM_API_KEY='your_token_here'")
-        return 1
-
-    # Get available models
-    print("\nFetching available models...")
-    models = get_available_models(llm_url, token)
+    # One client for both calls, so the model listing reuses the login's connection.
+    with httpx.Client(timeout=10.0) as client:
+        # Get token
+        print("\nAttempting to login to LLM_API_fast...")
+        token = get_llm_api_token(client, llm_url, username, password)
+
+        if not token:
+            print("\n[Setup] Could not obtain LLM_API_KEY automatically.")
+            print("        You'll need to set it manually:")
+            print("        export LLM_API_KEY='your_token_here'")
+            return 1
+
+        # Get available models
+        print("\nFetching available models...")
+        models = get_available_models(client, llm_url, token)
 
     llm_model = None
     if models:
@@ -3,6 +3,7 @@
 Quick test to verify LLM_API_fast connection and memory command parsing.
 """
 import json
+import re
 import sys
 import asyncio
 
@@ -10,6 +11,8 @@ import httpx
 
 import config
 
+_UPDATE_MEMORY_RE = re.compile(r"\[UPDATE_MEMORY:(.*?)\]", re.DOTALL)
+
 async def test_llm_connection():
     """Test if we can call LLM_API_fast."""
     print(f"Testing LLM_API_fast connection...")
@@ -64,8 +67,7 @@ async def test_llm_connection():
         # Check for memory command
         if "[UPDATE_MEMORY:" in reply:
             print("GOOD: Response contains [UPDATE_MEMORY: ...] command")
-            import re
-            match = re.search(r"\[UPDATE_MEMORY:(.*?)\]", reply, re.DOTALL)
+            match = _UPDATE_MEMORY_RE.search(reply)
             if match:
                 print(f"Extracted memory content: {match.group(1)[:100]}")
         else:
@@ -27,10 +27,8 @@ if ($Build) {
     & $Python -m pip install -r "deps\requirements.txt"
 }
 
-$MessengerUrl = & $Python -c "import config; print(config.MESSENGER_URL)"
-$LlmApiUrl = & $Python -c "import config; print(config.LLM_API_URL)"
-$HoonbotPort = & $Python -c "import config; print(config.HOONBOT_PORT)"
-$LogFile = & $Python -c "import config; from pathlib import Path; print(Path(config.DATA_DIR) / 'hoonbot.log')"
+# One interpreter start (and one config import) for all launcher settings.
+$MessengerUrl, $LlmApiUrl, $HoonbotPort, $LogFile = & $Python -c "import config; from pathlib import Path; print(config.MESSENGER_URL, config.LLM_API_URL, config.HOONBOT_PORT, Path(config.DATA_DIR) / 'hoonbot.log', sep='\n')"
 
 if ((-not (Test-Path "data\.llm_key")) -or (-not (Test-Path "data\.llm_model"))) {
     Write-Host "[setup] LLM credentials not found. Running setup..."
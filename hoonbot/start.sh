@@ -64,10 +64,9 @@ if $BUILD; then
     install_python_requirements
 fi
 
-MESSENGER_URL=$("$PYTHON_BIN" -c "import config; print(config.MESSENGER_URL)")
-LLM_API_URL=$("$PYTHON_BIN" -c "import config; print(config.LLM_API_URL)")
-HOONBOT_PORT=$("$PYTHON_BIN" -c "import config; print(config.HOONBOT_PORT)")
-LOG_FILE=$("$PYTHON_BIN" -c "import config; from pathlib import Path; print(Path(config.DATA_DIR) / 'hoonbot.log')")
+# One interpreter start (and one config import) for all launcher settings.
+CONFIG_VALUES=$("$PYTHON_BIN" -c "import config; from pathlib import Path; print(config.MESSENGER_URL, config.LLM_API_URL, config.HOONBOT_PORT, Path(config.DATA_DIR) / 'hoonbot.log', sep='\n')")
+{ read -r MESSENGER_URL; read -r LLM_API_URL; read -r HOONBOT_PORT; read -r LOG_FILE; } <<< "$CONFIG_VALUES"
 
 if [[ ! -f "data/.llm_key" || ! -f "data/.llm_model" ]]; then
     echo "[setup] LLM credentials not found. Running setup..."
@@ -76,14 +75,14 @@ if [[ ! -f "data/.llm_key" || ! -f "data/.llm_model" ]]; then
 fi
 
 echo "[check] Messenger: $MESSENGER_URL"
-if curl -fsS "${MESSENGER_URL}/health" >/dev/null 2>&1; then
+if curl -fsS --max-time 3 "${MESSENGER_URL}/health" >/dev/null 2>&1; then
     echo "[ok] Messenger reachable."
 else
     echo "[warn] Messenger not reachable. Hoonbot will retry on startup."
 fi
 
 echo "[check] LLM API: $LLM_API_URL"
-if curl -fsS "${LLM_API_URL}/health" >/dev/null 2>&1; then
+if curl -fsS --max-time 3 "${LLM_API_URL}/health" >/dev/null 2>&1; then
     echo "[ok] LLM API reachable."
 else
     echo "[warn] LLM API not reachable."
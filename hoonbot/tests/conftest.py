@@ -0,0 +1,5 @@
+"""Make hoonbot's top-level modules (config, core, handlers) importable."""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
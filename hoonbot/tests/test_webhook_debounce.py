@@ -0,0 +1,46 @@
+"""Duplicate handling in the webhook debounce window."""
+import asyncio
+
+import pytest
+
+import config
+from core import messenger
+from handlers import webhook
+
+
+@pytest.fixture(autouse=True)
+def _isolated_debounce(monkeypatch):
+    # Keep the window open for the whole test and skip Messenger calls.
+    monkeypatch.setattr(config, "DEBOUNCE_SECONDS", 60.0)
+    monkeypatch.setattr(messenger, "spawn", lambda coro: coro.close())
+    webhook._room_debounce.clear()
+    webhook._room_inflight.clear()
+    webhook._room_active_task.clear()
+    yield
+    for entry in webhook._room_debounce.values():
+        entry["handle"].cancel()
+    webhook._room_debounce.clear()
+
+
+def _pending_after(*messages) -> str:
+    async def run():
+        for sender, content, msg_id in messages:
+            webhook._schedule_debounced(1, content, sender, msg_id)
+        return webhook._room_debounce[1]["content"]
+    return asyncio.run(run())
+
+
+def test_same_sender_same_text_is_dropped():
+    assert _pending_after(("alice", "ok", 10), ("alice", "ok", 11)) == "ok"
+
+
+def test_different_sender_same_text_is_kept():
+    assert _pending_after(("alice", "ok", 10), ("bob", "ok", 11)) == "ok\nok"
+
+
+def test_redelivered_message_id_is_dropped():
+    assert _pending_after(("alice", "hello", 10), ("alice", "hello again", 10)) == "hello"
+
+
+def test_distinct_messages_are_merged():
+    assert _pending_after(("alice", "first", 10), ("alice", "second", 11)) == "first\nsecond"
@@ -71,7 +71,8 @@ class AgentLoop(LoggingMixin, CompactionMixin, DispatchMixin, FormattingMixin, P
         # Structured/guided decoding (opt-in, forwarded to vLLM on each call).
         self.response_format = response_format
         self.guided_json = guided_json
-        self.tool_calls_log: List[Dict[str, Any]] = []
+        # Bounded: deque evicts the oldest entry on append past maxlen.
+        self.tool_calls_log: Deque[Dict[str, Any]] = deque(maxlen=200)
         self._iteration_boundaries: List[int] = []
         self._available_rag_collections: Optional[List[str]] = None
         self._tool_cache: Dict[str, Any] = {}
@@ -611,7 +612,6 @@ class AgentLoop(LoggingMixin, CompactionMixin, DispatchMixin, FormattingMixin, P
             # Preserved in history but NOT yielded to the caller, so the user
             # never sees raw chain-of-thought.
             streamed_reasoning_parts: list[str] = []
-            log_start = len(self.tool_calls_log)
 
             # Compressed view is rebuilt per attempt inside the wrapper. msgs
             # is the source-of-truth list; auto-compact mutates it on overflow.
@@ -797,10 +797,13 @@ class AgentLoop(LoggingMixin, CompactionMixin, DispatchMixin, FormattingMixin, P
                     )
                     break
 
-            new_entries = self.tool_calls_log[log_start:]
+            # Match by call id rather than by log position: the log is
+            # bounded, so positions shift once it is full.
+            call_ids = {tc.id for tc in all_tool_calls}
             duration_by_call_id = {
                 e.get("tool_call_id"): e.get("duration", 0)
-                for e in new_entries
+                for e in self.tool_calls_log
+                if e.get("tool_call_id") in call_ids
             }
             durations = [duration_by_call_id.get(tc.id, 0) for tc in all_tool_calls]
             self._log_execution_summary(all_tool_calls, results, durations, iteration)
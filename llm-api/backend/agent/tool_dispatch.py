@@ -81,8 +81,6 @@ class DispatchMixin:
                 "name": name, "input": arguments, "tool_call_id": tool_call_id,
                 "success": cached.get("success", True), "duration": duration, "cached": True,
             })
-            if len(self.tool_calls_log) > 200:
-                self.tool_calls_log = self.tool_calls_log[-200:]
             self._log_tool_result(name, tool_call_id, cached, duration)
             return cached
 
@@ -95,8 +93,6 @@ class DispatchMixin:
                 "tool_call_id": tool_call_id,
                 "success": result.get("success", True), "duration": duration,
             })
-            if len(self.tool_calls_log) > 200:
-                self.tool_calls_log = self.tool_calls_log[-200:]
             self._log_tool_result(name, tool_call_id, result, duration)
             self._track_temp_files(name, result)
             await self._run_postchecks(name, result)
@@ -118,8 +114,6 @@ class DispatchMixin:
                 "tool_call_id": tool_call_id,
                 "success": False, "error": str(e), "duration": duration,
             })
-            if len(self.tool_calls_log) > 200:
-                self.tool_calls_log = self.tool_calls_log[-200:]
             self._log_tool_result(name, tool_call_id, err_result, duration)
             return err_result
 
@@ -336,6 +336,12 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     from backend.core.llm_backend import _backend
+    from backend.utils.subprocess_stream import kill_tracked_processes
+    # Tool subprocesses run in their own process group, out of reach of the
+    # server's Ctrl+C, so take down any still running explicitly.
+    killed = await kill_tracked_processes()
+    if killed:
+        print(f"[Shutdown] Killed {killed} running tool process tree(s)")
     await _backend.close()
     print("[Shutdown] HTTP connection pool closed")
 
@@ -1,7 +1,13 @@
-"""Master cluster registry and task lease APIs."""
+"""Master cluster registry and task lease APIs.
+
+ClusterStore is synchronous file I/O under FileLock (lease_task scans the whole
+task directory; artifacts can be 50MB), so every store call runs in a worker
+thread via asyncio.to_thread to keep the event loop free for streaming chat.
+"""
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
 from fastapi import APIRouter, File, Form, HTTPException, Request, UploadFile
@@ -39,7 +45,7 @@ async def register_node(request: Request):
     _auth(request)
     payload = await request.json()
     try:
-        node = cluster_store.register_node(payload)
+        node = await asyncio.to_thread(cluster_store.register_node, payload)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc))
     return {"ok": True, "node": node}
@@ -51,7 +57,7 @@ async def heartbeat_node(request: Request):
     payload = await request.json()
     node_name = str(payload.get("node_name") or "").strip()
     try:
-        node = cluster_store.heartbeat_node(node_name, payload)
+        node = await asyncio.to_thread(cluster_store.heartbeat_node, node_name, payload)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc))
     return {"ok": True, "node": node}
@@ -60,13 +66,13 @@ async def heartbeat_node(request: Request):
 @router.get("/nodes")
 async def list_nodes(request: Request):
     _auth(request)
-    return {"nodes": cluster_store.list_nodes()}
+    return {"nodes": await asyncio.to_thread(cluster_store.list_nodes)}
 
 
 @router.get("/status")
 async def cluster_status(request: Request):
     _auth(request)
-    return cluster_store.status()
+    return await asyncio.to_thread(cluster_store.status)
 
 
 @router.post("/tasks")
@@ -74,7 +80,7 @@ async def create_task(request: Request):
     _auth(request)
     payload: dict[str, Any] = await request.json()
     try:
-        task = cluster_store.create_task(payload)
+        task = await asyncio.to_thread(cluster_store.create_task, payload)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc))
     return {"ok": True, "task": task}
@@ -83,7 +89,8 @@ async def create_task(request: Request):
 @router.get("/tasks")
 async def list_tasks(request: Request, include_completed: bool = True):
     _auth(request)
-    return {"tasks": cluster_store.list_tasks(include_completed=include_completed)}
+    tasks = await asyncio.to_thread(cluster_store.list_tasks, include_completed=include_completed)
+    return {"tasks": tasks}
 
 
 @router.post("/tasks/lease")
@@ -94,7 +101,7 @@ async def lease_task(request: Request):
     capabilities = list(payload.get("capabilities") or [])
     tags = list(payload.get("tags") or [])
     try:
-        task = cluster_store.lease_task(node_name, capabilities, tags)
+        task = await asyncio.to_thread(cluster_store.lease_task, node_name, capabilities, tags)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc))
     return {"ok": True, "task": task}
@@ -103,19 +110,20 @@ async def lease_task(request: Request):
 @router.get("/tasks/{task_id}")
 async def get_task(task_id: str, request: Request):
     _auth(request)
-    task = cluster_store.load_task(task_id)
+    task = await asyncio.to_thread(cluster_store.load_task, task_id)
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
-    return {"task": task, "events": cluster_store.load_events(task_id)}
+    events = await asyncio.to_thread(cluster_store.load_events, task_id)
+    return {"task": task, "events": events}
 
 
 @router.post("/tasks/{task_id}/events")
 async def append_task_event(task_id: str, request: Request):
     _auth(request)
-    if not cluster_store.load_task(task_id):
+    if not await asyncio.to_thread(cluster_store.load_task, task_id):
         raise HTTPException(status_code=404, detail="Task not found")
     payload = await request.json()
-    event = cluster_store.append_event(task_id, payload)
+    event = await asyncio.to_thread(cluster_store.append_event, task_id, payload)
     return {"ok": True, "event": event}
 
 
@@ -129,7 +137,9 @@ async def upload_task_artifact(
     _auth(request)
     content = await file.read()
     try:
-        artifact = cluster_store.save_artifact(task_id, node_name, file.filename or "", content)
+        artifact = await asyncio.to_thread(
+            cluster_store.save_artifact, task_id, node_name, file.filename or "", content
+        )
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Task not found")
     except ValueError as exc:
@@ -142,7 +152,7 @@ async def complete_task(task_id: str, request: Request):
     _auth(request)
     payload = await request.json()
     try:
-        task = cluster_store.complete_task(task_id, payload)
+        task = await asyncio.to_thread(cluster_store.complete_task, task_id, payload)
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Task not found")
     except ValueError as exc:
@@ -36,6 +36,12 @@ _running_tasks: Dict[str, asyncio.Task] = {}
 # Per-job asyncio.Event for SSE stream wake-up — replaces 0.2s polling
 _job_signals: Dict[str, asyncio.Event] = {}
 
+# Streamed text is coalesced before hitting the job file: each append_chunk
+# takes the job lock and rewrites the metadata JSON, so per-token appends are
+# expensive. Flush after this delay or once this many chars are pending.
+_OUTPUT_FLUSH_SECONDS = 0.02
+_OUTPUT_FLUSH_CHARS = 4096
+
 
 def _get_job_signal(job_id: str) -> asyncio.Event:
     if job_id not in _job_signals:
@@ -66,6 +72,24 @@ async def _run_job(
     """Run the agent loop in the background, streaming output to the job file."""
     from backend.agent import AgentLoop
 
+    loop = asyncio.get_running_loop()
+    pending: List[str] = []
+    pending_chars = 0
+    flush_handle: Optional[asyncio.TimerHandle] = None
+
+    def _flush_output():
+        nonlocal pending_chars, flush_handle
+        if flush_handle is not None:
+            flush_handle.cancel()
+            flush_handle = None
+        if not pending:
+            return
+        text = "".join(pending)
+        pending.clear()
+        pending_chars = 0
+        job_store.append_chunk(job_id, text)
+        _signal_job(job_id)
+
     job_store.update_status(job_id, "running")
     _signal_job(job_id)
     try:
@@ -76,13 +100,19 @@ async def _run_job(
             username=username,
         )
 
-        assistant_message = ""
+        assistant_parts: List[str] = []
         async for event in agent.run_stream(messages, file_metadata):
             if isinstance(event, TextEvent):
-                assistant_message += event.content
-                job_store.append_chunk(job_id, event.content)
-                _signal_job(job_id)
+                assistant_parts.append(event.content)
+                pending.append(event.content)
+                pending_chars += len(event.content)
+                if pending_chars >= _OUTPUT_FLUSH_CHARS:
+                    _flush_output()
+                elif flush_handle is None:
+                    flush_handle = loop.call_later(_OUTPUT_FLUSH_SECONDS, _flush_output)
             elif isinstance(event, ToolStatusEvent):
+                # Keep output and tool events in order in the job log.
+                _flush_output()
                 job_store.append_tool_event(
                     job_id,
                     tool_name=event.tool_name,
@@ -92,11 +122,12 @@ async def _run_job(
                     user_name=getattr(event, "user_name", ""),
                 )
                 _signal_job(job_id)
+        _flush_output()
 
         await asyncio.to_thread(
             conversation_store.append_messages,
             session_id,
-            [{"role": "assistant", "content": assistant_message}],
+            [{"role": "assistant", "content": "".join(assistant_parts)}],
         )
         await asyncio.to_thread(db.increment_session_message_count, session_id, 1)
 
@@ -104,9 +135,11 @@ async def _run_job(
         _signal_job(job_id)
 
     except asyncio.CancelledError:
+        _flush_output()
         job_store.update_status(job_id, "cancelled")
         _signal_job(job_id)
     except Exception as e:
+        _flush_output()
         job_store.update_status(job_id, "failed", error=str(e))
         _signal_job(job_id)
     finally:
@@ -22,6 +22,8 @@ import config
 MAX_ARTIFACTS_PER_TASK = 10
 MAX_ARTIFACT_BYTES = 50 * 1024 * 1024
 
+_TERMINAL_STATUSES = frozenset({"completed", "failed", "cancelled"})
+
 
 def _now() -> datetime:
     return datetime.now(timezone.utc)
@@ -47,6 +49,9 @@ class ClusterStore:
         self.artifacts_dir = self.base_dir / "artifacts"
         self.nodes_file = self.base_dir / "nodes.json"
         self.lock_file = self.base_dir / "cluster.lock"
+        # Task ids known to be in a terminal state. Terminal tasks never return
+        # to the queue, so lease_task skips them without locking or reading.
+        self._terminal_ids: set[str] = set()
         self.base_dir.mkdir(parents=True, exist_ok=True)
         self.tasks_dir.mkdir(parents=True, exist_ok=True)
         self.artifacts_dir.mkdir(parents=True, exist_ok=True)
@@ -83,11 +88,12 @@ class ClusterStore:
 
         with FileLock(self.lock_file, timeout=10):
             nodes = self._read_nodes_unlocked()
-            node = nodes.get(node_name, {"node_name": node_name, "registered_at": _iso()})
+            now = _iso()
+            node = nodes.get(node_name, {"node_name": node_name, "registered_at": now})
             node.update(payload)
             node["node_name"] = node_name
             node["status"] = "online"
-            node["last_seen_at"] = _iso()
+            node["last_seen_at"] = now
             nodes[node_name] = node
             self._write_nodes_unlocked(nodes)
             return node
@@ -95,7 +101,8 @@ class ClusterStore:
     def list_nodes(self) -> list[dict[str, Any]]:
         with FileLock(self.lock_file, timeout=10):
             nodes = list(self._read_nodes_unlocked().values())
-        return [self._with_health(node) for node in nodes]
+        now = _now()
+        return [self._with_health(node, now) for node in nodes]
 
     def status(self) -> dict[str, Any]:
         nodes = self.list_nodes()
@@ -138,6 +145,7 @@ class ClusterStore:
         }
         with FileLock(self._task_lock(task_id), timeout=10):
             self._write_task_unlocked(task)
+        self._terminal_ids.discard(task_id)
         return task
 
     def lease_task(self, node_name: str, capabilities: list[str], tags: list[str]) -> dict[str, Any] | None:
@@ -151,16 +159,25 @@ class ClusterStore:
 
         for path in sorted(self.tasks_dir.glob("*.json"), key=lambda p: p.stat().st_mtime):
             task_id = path.stem
+            if task_id in self._terminal_ids:
+                continue
             with FileLock(self._task_lock(task_id), timeout=10):
                 task = self._read_task_unlocked(task_id)
                 if not task:
                     continue
+                status = task.get("status")
+                if status in _TERMINAL_STATUSES:
+                    self._terminal_ids.add(task_id)
+                    continue
                 task = self._recover_expired_lease(task, now)
-                if task.get("status") != "queued":
+                # Only rewrite when a lease was actually recovered: rewriting
+                # untouched tasks costs a write per file and bumps the mtime
+                # the queue is ordered by.
+                if task.get("status") != status:
                     self._write_task_unlocked(task)
+                if task.get("status") != "queued":
                     continue
                 if not self._matches_node(task, node_name, caps, node_tags):
-                    self._write_task_unlocked(task)
                     continue
 
                 task["status"] = "leased"
@@ -186,7 +203,7 @@ class ClusterStore:
             task = self.load_task(path.stem)
             if not task:
                 continue
-            if include_completed or task.get("status") not in {"completed", "failed", "cancelled"}:
+            if include_completed or task.get("status") not in _TERMINAL_STATUSES:
                 tasks.append(self._strip_task(task))
         return tasks
 
@@ -218,6 +235,7 @@ class ClusterStore:
             task["result"] = payload.get("result")
             task["error"] = payload.get("error")
             self._write_task_unlocked(task)
+        self._terminal_ids.add(task_id)
         self.append_event(task_id, {
             "type": status,
             "node_name": payload.get("node_name"),
@@ -320,12 +338,12 @@ class ClusterStore:
     # Matching and summaries
     # ------------------------------------------------------------------
 
-    def _with_health(self, node: dict[str, Any]) -> dict[str, Any]:
+    def _with_health(self, node: dict[str, Any], now: datetime) -> dict[str, Any]:
         last_seen = _parse_iso(node.get("last_seen_at"))
         stale = True
         age = None
         if last_seen:
-            age = max(0, int((_now() - last_seen).total_seconds()))
+            age = max(0, int((now - last_seen).total_seconds()))
             stale = age > config.CLUSTER_NODE_STALE_SECONDS
         return {
             **node,
@@ -6,7 +6,7 @@ Streamed output and tool events are append-only sidecar files.
 import json
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from filelock import FileLock
 
@@ -19,6 +19,10 @@ class JobStore:
     def __init__(self, jobs_dir: Path = None):
         self.jobs_dir = jobs_dir or config.JOBS_DIR
         self.jobs_dir.mkdir(parents=True, exist_ok=True)
+        # job_id -> ((st_mtime_ns, st_size), stripped summary). list_jobs only
+        # re-parses job files whose stat key changed since the last listing;
+        # size catches back-to-back writes within the mtime granularity.
+        self._summary_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
 
     # ------------------------------------------------------------------
     # File helpers
@@ -89,10 +93,11 @@ class JobStore:
             if job is None:
                 return
             job["status"] = status
+            now = datetime.now().isoformat()
             if status == "running" and job.get("started_at") is None:
-                job["started_at"] = datetime.now().isoformat()
+                job["started_at"] = now
             if status in ("completed", "failed", "cancelled"):
-                job["completed_at"] = datetime.now().isoformat()
+                job["completed_at"] = now
             if error is not None:
                 job["error"] = error
             self._write_unlocked(job_id, job)
@@ -189,14 +194,33 @@ class JobStore:
 
     def list_jobs(self, username: str) -> List[Dict[str, Any]]:
         """List all jobs for a user (metadata only)."""
-        jobs = []
-        for path in sorted(self.jobs_dir.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True):
+        entries = []
+        for path in self.jobs_dir.glob("*.json"):
             try:
-                job = json.loads(path.read_text(encoding="utf-8"))
-                if job.get("username") == username:
-                    jobs.append(self._strip_output(job))
-            except Exception:
+                st = path.stat()
+                entries.append((path, (st.st_mtime_ns, st.st_size)))
+            except OSError:
                 continue
+        entries.sort(key=lambda e: e[1][0], reverse=True)
+
+        seen = set()
+        jobs = []
+        for path, stat_key in entries:
+            job_id = path.stem
+            seen.add(job_id)
+            cached = self._summary_cache.get(job_id)
+            if cached is not None and cached[0] == stat_key:
+                summary = cached[1]
+            else:
+                try:
+                    summary = self._strip_output(json.loads(path.read_text(encoding="utf-8")))
+                except Exception:
+                    continue
+                self._summary_cache[job_id] = (stat_key, summary)
+            if summary.get("username") == username:
+                jobs.append(dict(summary))
+        for job_id in self._summary_cache.keys() - seen:
+            self._summary_cache.pop(job_id, None)
         return jobs
 
     def delete(self, job_id: str) -> bool:
@@ -10,6 +10,13 @@ import httpx
 
 import config
 
+# orjson is an optional speedup for the per-chunk SSE parse; its
+# JSONDecodeError subclasses json.JSONDecodeError, so callers catch either.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 
 # ============================================================================
 # Response Types
@@ -125,6 +132,9 @@ def _split_inline_reasoning(buf: str, in_think: bool) -> tuple[str, str, str, bo
     next chunk; nothing is ever dropped. When no `<think>` tag is present this
     is a passthrough (text == buf, carry == "") apart from holding back a
     trailing partial-tag prefix by one chunk."""
+    # Fast path for the common chunk: no "<" means no tag and no partial tag.
+    if "<" not in buf:
+        return ("", buf, "", True) if in_think else (buf, "", "", False)
     text_parts: list[str] = []
     reason_parts: list[str] = []
     while buf:
@@ -358,33 +368,41 @@ class VllmBackend:
                     break
 
                 try:
-                    chunk = json.loads(data_str)
+                    chunk = _json_loads(data_str)
                 except json.JSONDecodeError:
                     continue
 
                 # Usage arrives in its own trailing chunk (choices is empty).
                 # Capture it before the empty-choices skip below.
-                if chunk.get("usage"):
-                    usage = chunk["usage"]
+                chunk_usage = chunk.get("usage")
+                if chunk_usage:
+                    usage = chunk_usage
 
-                choices = chunk.get("choices", [])
+                choices = chunk.get("choices")
                 if not choices:
                     continue
-                delta = choices[0].get("delta", {})
-                chunk_finish = choices[0].get("finish_reason")
+                choice = choices[0]
+                delta = choice.get("delta") or {}
+                chunk_finish = choice.get("finish_reason")
                 if chunk_finish:
                     finish_reason = chunk_finish
 
+                # One lookup per delta key: nearly every chunk is a plain text
+                # delta, so avoid the "in" + index double lookups on the hot path.
+                reasoning_delta = delta.get("reasoning_content")
+                content_delta = delta.get("content")
+                tool_call_deltas = delta.get("tool_calls")
+
                 # Reasoning content (MiniMax M2, Qwen3-Thinking, DeepSeek-R1).
                 # Preserved in history but not surfaced to the user.
-                if "reasoning_content" in delta and delta["reasoning_content"]:
-                    yield ReasoningEvent(content=delta["reasoning_content"])
+                if reasoning_delta:
+                    yield ReasoningEvent(content=reasoning_delta)
 
                 # Text content — peel any inline <think>...</think> back out so
                 # reasoning is surfaced as ReasoningEvent (kept in history, not
                 # shown) and only the real answer reaches the user as TextEvent.
-                if "content" in delta and delta["content"]:
-                    think_buf += delta["content"]
+                if content_delta:
+                    think_buf += content_delta
                     text_out, reason_out, think_buf, in_think = _split_inline_reasoning(
                         think_buf, in_think
                     )
@@ -394,8 +412,8 @@ class VllmBackend:
                         yield TextEvent(content=text_out)
 
                 # Tool call deltas
-                if "tool_calls" in delta:
-                    for tc_delta in delta["tool_calls"]:
+                if tool_call_deltas:
+                    for tc_delta in tool_call_deltas:
                         idx = tc_delta.get("index", 0)
 
                         # A new index appearing means the PREVIOUS max index is complete.
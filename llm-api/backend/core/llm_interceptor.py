@@ -241,7 +241,7 @@ class LLMInterceptor:
             "agent_type": agent_type or "N/A",
         }
 
-        collected_text = ""
+        text_parts: List[str] = []
         collected_tool_calls = None
         real_usage = None
 
@@ -256,7 +256,7 @@ class LLMInterceptor:
                 guided_json=guided_json, response_format=response_format,
             ):
                 if isinstance(event, TextEvent):
-                    collected_text += event.content
+                    text_parts.append(event.content)
                 elif isinstance(event, ToolCallDeltaEvent):
                     collected_tool_calls = event.tool_calls
                 elif isinstance(event, UsageEvent):
@@ -264,6 +264,7 @@ class LLMInterceptor:
                 yield event
 
             duration = time.time() - start_time
+            collected_text = "".join(text_parts)
             # Prefer vLLM's real token counts; fall back to estimates only when
             # the backend didn't report usage.
             if real_usage is not None:
@@ -292,6 +293,7 @@ class LLMInterceptor:
                 )[:3000]
 
         except Exception as e:
+            collected_text = "".join(text_parts)
             response_log["success"] = False
             response_log["error"] = self._format_exception(e)
             response_log["duration_seconds"] = time.time() - start_time
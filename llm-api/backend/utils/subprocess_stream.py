@@ -10,12 +10,93 @@ Two optional kill triggers (beyond normal exit):
                           Disabled when `timeout` is None or <= 0.
   - idle-stdout timeout : process produces no stdout for `idle_timeout` seconds
                           (catches hangs that produce no output).
+
+Killing takes down the whole process tree (see kill_process_tree): a child the
+program spawned would otherwise survive, keep the output pipes open, and leave
+the drain — and the caller — waiting on it.
 """
 import asyncio
+import os
+import signal
+import subprocess
+import sys
+import weakref
 from dataclasses import dataclass, field
 from typing import Optional
 
-_READ_CHUNK = 4096
+# Match the 64KB Linux pipe buffer so one read drains a full pipe.
+READ_CHUNK = 64 * 1024
+# StreamReader buffer limit (pauses the pipe at 2x this); keep it well above
+# READ_CHUNK so the reader, not the buffer, sets the pace.
+STREAM_LIMIT = 1024 * 1024
+# After a kill, how long to keep reading buffered output before giving up on
+# pipes still held open by a process that escaped the tree kill.
+_DRAIN_GRACE_SECONDS = 5.0
+
+# Pass to asyncio.create_subprocess_* so the child leads its own process group
+# and kill_process_tree() can reach everything it spawns. The trade-off: the
+# child no longer shares the server's terminal process group, so Ctrl+C on the
+# server does not reach it. Register it with track_process() so the server's
+# shutdown hook (kill_tracked_processes) still takes it down.
+if sys.platform == "win32":
+    PROCESS_GROUP_KWARGS: dict = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+else:
+    PROCESS_GROUP_KWARGS = {"start_new_session": True}
+
+# Tool subprocesses started with PROCESS_GROUP_KWARGS. Weak, so finished
+# runs drop out on their own without explicit bookkeeping.
+_tracked: "weakref.WeakSet[asyncio.subprocess.Process]" = weakref.WeakSet()
+
+
+def track_process(proc: asyncio.subprocess.Process) -> None:
+    """Register *proc* so kill_tracked_processes() reaches it at shutdown."""
+    _tracked.add(proc)
+
+
+async def kill_tracked_processes() -> int:
+    """Kill the process tree of every tracked subprocess still running.
+
+    Returns how many were killed.
+    """
+    running = [proc for proc in list(_tracked) if proc.returncode is None]
+    await asyncio.gather(*(kill_process_tree(proc) for proc in running), return_exceptions=True)
+    return len(running)
+
+
+async def kill_process_tree(proc: asyncio.subprocess.Process) -> None:
+    """Kill *proc* and all of its descendants, then reap it.
+
+    *proc* must have been started with PROCESS_GROUP_KWARGS.
+    """
+    if proc.returncode is None:
+        try:
+            if sys.platform == "win32":
+                killer = await asyncio.create_subprocess_exec(
+                    "taskkill", "/PID", str(proc.pid), "/T", "/F",
+                    stdout=asyncio.subprocess.DEVNULL,
+                    stderr=asyncio.subprocess.DEVNULL,
+                )
+                await killer.wait()
+            else:
+                os.killpg(proc.pid, signal.SIGKILL)
+        except (OSError, ProcessLookupError):
+            pass
+        try:
+            proc.kill()  # no-op if the tree kill already got it
+        except ProcessLookupError:
+            pass
+    try:
+        await proc.wait()
+    except Exception:
+        pass
+
+
+async def drain_after_kill(*tasks: asyncio.Task) -> None:
+    """Let drain tasks collect buffered output, cancelling any still blocked."""
+    _, pending = await asyncio.wait(tasks, timeout=_DRAIN_GRACE_SECONDS)
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
 
 
 @dataclass
@@ -35,7 +116,7 @@ async def _drain_into(
     """Drain *stream* into *buf*, capping stored bytes at max_bytes."""
     truncated = False
     while True:
-        chunk = await stream.read(_READ_CHUNK)
+        chunk = await stream.read(READ_CHUNK)
         if not chunk:
             return
         if truncated:
@@ -57,7 +138,7 @@ async def _drain_tracking(
     """Like _drain_into but updates last_seen[0] on every received chunk."""
     truncated = False
     while True:
-        chunk = await stream.read(_READ_CHUNK)
+        chunk = await stream.read(READ_CHUNK)
         if not chunk:
             return
         last_seen[0] = asyncio.get_running_loop().time()
@@ -92,7 +173,10 @@ async def run_streaming(
         cwd=cwd,
         stdout=asyncio.subprocess.PIPE,
         stderr=asyncio.subprocess.PIPE,
+        limit=STREAM_LIMIT,
+        **PROCESS_GROUP_KWARGS,
     )
+    track_process(proc)
 
     loop = asyncio.get_running_loop()
     stdout_buf = bytearray()
@@ -111,30 +195,32 @@ async def run_streaming(
 
     def _decode():
         return (
-            bytes(stdout_buf).decode('utf-8', errors='replace'),
-            bytes(stderr_buf).decode('utf-8', errors='replace'),
+            stdout_buf.decode('utf-8', errors='replace'),
+            stderr_buf.decode('utf-8', errors='replace'),
         )
 
     async def _kill_and_drain(idle: bool) -> StreamResult:
         proc_task.cancel()
-        try:
-            proc.kill()
-        except Exception:
-            pass
-        try:
-            await proc.wait()
-        except Exception:
-            pass
-        await asyncio.gather(stdout_task, stderr_task, return_exceptions=True)
+        await kill_process_tree(proc)
+        await drain_after_kill(stdout_task, stderr_task)
         out, err = _decode()
         return StreamResult(
             stdout=out, stderr=err,
             returncode=-1, timed_out=True, idle_killed=idle,
         )
 
-    # Poll every second; check both kill conditions.
+    # Sleep until the process exits or the nearest kill deadline arrives,
+    # instead of waking every second to re-check. The idle deadline moves
+    # forward whenever stdout arrives, so it is recomputed after each wake.
     while not proc_task.done():
-        done, _ = await asyncio.wait({proc_task}, timeout=1.0)
+        now = loop.time()
+        waits = []
+        if deadline is not None:
+            waits.append(deadline - now)
+        if idle_timeout is not None:
+            waits.append(last_stdout[0] + idle_timeout - now)
+        wait_for = max(0.0, min(waits)) if waits else None
+        done, _ = await asyncio.wait({proc_task}, timeout=wait_for)
         if proc_task in done:
             break
         now = loop.time()
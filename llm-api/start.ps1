@@ -31,9 +31,8 @@ if (-not (Test-Path "config.py")) {
     throw "config.py not found. Run this from llm-api."
 }
 
-$VllmHost = & $Python -c "import config; print(getattr(config, 'VLLM_HOST', 'http://127.0.0.1:10000'))"
-$ServerPort = & $Python -c "import config; print(getattr(config, 'SERVER_PORT', 10002))"
-$LogFile = & $Python -c "import config; print(config.LOG_DIR / 'llm_api.log')"
+# One interpreter start (and one config import) for all launcher settings.
+$VllmHost, $ServerPort, $LogFile = & $Python -c "import config; print(getattr(config, 'VLLM_HOST', 'http://127.0.0.1:10000'), getattr(config, 'SERVER_PORT', 10002), config.LOG_DIR / 'llm_api.log', sep='\n')"
 
 Write-Host "[check] vLLM: $VllmHost"
 try {
@@ -69,12 +69,12 @@ if [[ ! -f "config.py" ]]; then
     exit 1
 fi
 
-VLLM_HOST=$("$PYTHON_BIN" -c "import config; print(getattr(config, 'VLLM_HOST', 'http://127.0.0.1:10000'))")
-SERVER_PORT=$("$PYTHON_BIN" -c "import config; print(getattr(config, 'SERVER_PORT', 10002))")
-LOG_FILE=$("$PYTHON_BIN" -c "import config; print(config.LOG_DIR / 'llm_api.log')")
+# One interpreter start (and one config import) for all launcher settings.
+CONFIG_VALUES=$("$PYTHON_BIN" -c "import config; print(getattr(config, 'VLLM_HOST', 'http://127.0.0.1:10000'), getattr(config, 'SERVER_PORT', 10002), config.LOG_DIR / 'llm_api.log', sep='\n')")
+{ read -r VLLM_HOST; read -r SERVER_PORT; read -r LOG_FILE; } <<< "$CONFIG_VALUES"
 
 echo "[check] vLLM: $VLLM_HOST"
-if curl -fsS "${VLLM_HOST}/health" >/dev/null 2>&1; then
+if curl -fsS --max-time 3 "${VLLM_HOST}/health" >/dev/null 2>&1; then
     echo "[ok] vLLM reachable."
 else
     echo "[warn] inference will fail until vLLM is reachable."
@@ -18,6 +18,9 @@ import config
 from backend.utils.prompts_log_append import log_to_prompts_file
 from backend.utils.subprocess_stream import run_streaming
 
+_FIRST_DEF_RE = re.compile(r"^\s*def\s+(\w+)", re.MULTILINE)
+_FIRST_CLASS_RE = re.compile(r"^\s*class\s+(\w+)", re.MULTILINE)
+
 
 def _format_timeout(timeout: Optional[int]) -> str:
     return "never" if timeout is None else f"{timeout}s"
@@ -108,13 +111,12 @@ class CodeExecTool:
 
     def _make_script_name(self, code: str) -> str:
         """Generate a human-readable timestamped script filename."""
-        func_matches = re.findall(r"^\s*def\s+(\w+)", code, re.MULTILINE)
-        class_matches = re.findall(r"^\s*class\s+(\w+)", code, re.MULTILINE)
         ts = datetime.now().strftime("%H%M%S")
-        if func_matches:
-            return f"{func_matches[0]}_{ts}.py"
-        if class_matches:
-            return f"{class_matches[0].lower()}_{ts}.py"
+        # Only the first def/class names the file, so stop at the first match.
+        if func_match := _FIRST_DEF_RE.search(code):
+            return f"{func_match.group(1)}_{ts}.py"
+        if class_match := _FIRST_CLASS_RE.search(code):
+            return f"{class_match.group(1).lower()}_{ts}.py"
         return f"exec_{ts}.py"
 
     def _log_execution_start(self, code: str, script_name: str, timeout: Optional[int]) -> None:
@@ -15,10 +15,12 @@ from rank_bm25 import BM25Okapi
 # Standard RRF constant (from the original RRF paper)
 RRF_K = 60
 
+_WORD_RE = re.compile(r'\w+')
+
 
 def tokenize(text: str) -> List[str]:
     """Simple word tokenization for BM25 (shared with index build)."""
-    return re.findall(r'\w+', text.lower())
+    return _WORD_RE.findall(text.lower())
 
 
 class HybridRetriever:
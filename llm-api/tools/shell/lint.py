@@ -1,14 +1,48 @@
 """ShellLintTool: static analysis for .ps1 (PSScriptAnalyzer) and .sh (shellcheck/bash -n)."""
 import json
 import platform
+import shutil
 import subprocess
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 
 _MAX_FINDINGS = 50
 _TIMEOUT = 30
 
+# Resolved once: a PATH walk is far cheaper than spawning a missing binary on
+# every lint call just to catch FileNotFoundError.
+_PS_BIN: Optional[str] = shutil.which(
+    "powershell.exe" if platform.system() == "Windows" else "pwsh"
+)
+_SHELLCHECK_BIN: Optional[str] = shutil.which("shellcheck")
+_BASH_BIN: Optional[str] = shutil.which("bash")
+
+# Whether PSScriptAnalyzer is installed, checked once with Get-Module on first
+# use. Without it every .ps1 lint would pay a PowerShell cold start that can
+# only fail before falling back to PSParser. None = not yet known.
+_psa_available: Optional[bool] = None
+
+
+def _psscriptanalyzer_available() -> bool:
+    global _psa_available
+    if _psa_available is None:
+        if _PS_BIN is None:
+            _psa_available = False
+        else:
+            try:
+                proc = subprocess.run(
+                    [_PS_BIN, "-NoProfile", "-NonInteractive", "-Command",
+                     "if (Get-Module -ListAvailable PSScriptAnalyzer) { 'yes' }"],
+                    capture_output=True, text=True, timeout=_TIMEOUT,
+                )
+            except (OSError, subprocess.TimeoutExpired):
+                return False  # inconclusive; ask again next time
+            if proc.returncode != 0:
+                return False
+            _psa_available = proc.stdout.strip() == "yes"
+    return _psa_available
+
 
 class ShellLintTool:
     """Run PSScriptAnalyzer (Windows) or shellcheck/bash -n (Unix) on a shell script."""
@@ -45,7 +79,8 @@ class ShellLintTool:
         return self._try_psparser(path, is_windows)
 
     def _try_psscriptanalyzer(self, path: Path, is_windows: bool) -> Dict[str, Any]:
-        shell_exe = "powershell.exe" if is_windows else "pwsh"
+        if not _psscriptanalyzer_available():
+            return None
         ps_code = (
             f"$results = Invoke-ScriptAnalyzer -Path '{path}' -Severity Error,Warning 2>$null; "
             f"$results | ForEach-Object {{ "
@@ -53,7 +88,7 @@ class ShellLintTool:
         )
         try:
             proc = subprocess.run(
-                [shell_exe, "-NoProfile", "-NonInteractive", "-Command", ps_code],
+                [_PS_BIN, "-NoProfile", "-NonInteractive", "-Command", ps_code],
                 capture_output=True, text=True, timeout=_TIMEOUT,
             )
             # If PSScriptAnalyzer is not installed, stdout is empty and no crash
@@ -67,7 +102,9 @@ class ShellLintTool:
             return None
 
     def _try_psparser(self, path: Path, is_windows: bool) -> Dict[str, Any]:
-        shell_exe = "powershell.exe" if is_windows else "pwsh"
+        # Last resort, so a missing binary is still run by name and reported
+        # through the FileNotFoundError below.
+        shell_exe = _PS_BIN or ("powershell.exe" if is_windows else "pwsh")
         ps_code = (
             f"$errors = $null; "
             f"[void][System.Management.Automation.PSParser]::Tokenize("
@@ -98,9 +135,11 @@ class ShellLintTool:
         return self._try_bash_n(path)
 
     def _try_shellcheck(self, path: Path) -> Dict[str, Any]:
+        if _SHELLCHECK_BIN is None:
+            return None
         try:
             proc = subprocess.run(
-                ["shellcheck", "-f", "json", str(path)],
+                [_SHELLCHECK_BIN, "-f", "json", str(path)],
                 capture_output=True, text=True, timeout=_TIMEOUT,
             )
             data = json.loads(proc.stdout or "[]")
@@ -118,7 +157,7 @@ class ShellLintTool:
     def _try_bash_n(self, path: Path) -> Dict[str, Any]:
         try:
             proc = subprocess.run(
-                ["bash", "-n", str(path)],
+                [_BASH_BIN or "bash", "-n", str(path)],
                 capture_output=True, text=True, timeout=_TIMEOUT,
             )
             lines = [l for l in proc.stderr.splitlines() if l.strip()]
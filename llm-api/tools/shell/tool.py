@@ -14,9 +14,16 @@ from pathlib import Path
 from typing import Dict, Any, Optional
 
 import config
+from backend.utils.subprocess_stream import (
+    PROCESS_GROUP_KWARGS,
+    READ_CHUNK,
+    STREAM_LIMIT,
+    drain_after_kill,
+    kill_process_tree,
+    track_process,
+)
 
 MAX_OUTPUT_SIZE = 50 * 1024  # 50KB cap per stream
-_READ_CHUNK = 4096
 
 _CURL_HTTP_RE = re.compile(r"(?i)(^|[\s;&|()])(?:curl|curl\.exe)(?=$|[\s])")
 _HTTP_URL_RE = re.compile(r"(?i)https?://")
@@ -52,7 +59,7 @@ async def _drain_into(
     """
     truncated = False
     while True:
-        chunk = await stream.read(_READ_CHUNK)
+        chunk = await stream.read(READ_CHUNK)
         if not chunk:
             return
         if truncated:
@@ -66,7 +73,8 @@ async def _drain_into(
 
 
 def _decode(buf: bytearray) -> str:
-    return bytes(buf).decode('utf-8', errors='replace')
+    # bytearray decodes in place; bytes(buf) would copy the whole buffer first.
+    return buf.decode('utf-8', errors='replace')
 
 
 class ShellExecTool:
@@ -156,7 +164,10 @@ class ShellExecTool:
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
                 cwd=str(cwd),
+                limit=STREAM_LIMIT,
+                **PROCESS_GROUP_KWARGS,
             )
+            track_process(proc)
         except Exception as e:
             return {
                 "success": False,
@@ -177,13 +188,11 @@ class ShellExecTool:
             kill_on_timeout = getattr(config, "SHELL_EXEC_KILL_ON_TIMEOUT", True)
 
             if kill_on_timeout:
-                # Kill → pipes close → drain tasks finish cleanly
-                try:
-                    proc.kill()
-                    await proc.wait()
-                except Exception:
-                    pass
-                await asyncio.gather(stdout_task, stderr_task, return_exceptions=True)
+                # Kill the shell and everything it started → pipes close →
+                # drain tasks finish cleanly. Killing only the shell would
+                # leave the command itself running with the pipes open.
+                await kill_process_tree(proc)
+                await drain_after_kill(stdout_task, stderr_task)
                 return {
                     "success": False,
                     "killed": True,
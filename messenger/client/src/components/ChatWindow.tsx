@@ -170,16 +170,37 @@ export default function ChatWindow({ room, user, users, onlineUserIds, onLeaveRo
       );
     };
 
-    const handleMessageRead = (data: { messageId: number; userId: number }) => {
+    // Receipts arrive in bursts (opening a room acknowledges every unread
+    // message at once). Queue them and apply each burst as one state update
+    // per frame instead of re-mapping and re-rendering the list per receipt.
+    let pendingReads: { messageId: number; userId: number }[] = [];
+    let readFlushFrame: number | null = null;
+
+    const flushReads = () => {
+      readFlushFrame = null;
+      const readers = new Map<number, number[]>();
+      for (const { messageId, userId } of pendingReads) {
+        const ids = readers.get(messageId);
+        if (ids) ids.push(userId);
+        else readers.set(messageId, [userId]);
+      }
+      pendingReads = [];
       setMessages((prev) =>
-        prev.map((m) =>
-          m.id === data.messageId
-            ? { ...m, readBy: [...(m.readBy || []), data.userId].filter((v, i, a) => a.indexOf(v) === i) }
-            : m
-        )
+        prev.map((m) => {
+          const ids = readers.get(m.id);
+          if (!ids) return m;
+          const readBy = m.readBy || [];
+          const added = ids.filter((v, i, a) => !readBy.includes(v) && a.indexOf(v) === i);
+          return added.length > 0 ? { ...m, readBy: [...readBy, ...added] } : m;
+        })
       );
     };
 
+    const handleMessageRead = (data: { messageId: number; userId: number }) => {
+      pendingReads.push({ messageId: data.messageId, userId: data.userId });
+      if (readFlushFrame === null) readFlushFrame = requestAnimationFrame(flushReads);
+    };
+
     // Client-side typing auto-clear timeouts (safety net)
     const typingAutoClears = new Map<number, ReturnType<typeof setTimeout>>();
 
@@ -263,6 +284,7 @@ export default function ChatWindow({ room, user, users, onlineUserIds, onLeaveRo
       socket.off('message_pinned', handleMessagePinned);
       socket.off('message_unpinned', handleMessageUnpinned);
       socket.off('room_messages_cleared', handleMessagesCleared);
+      if (readFlushFrame !== null) cancelAnimationFrame(readFlushFrame);
       // Clear all auto-clear timers
       for (const timer of typingAutoClears.values()) clearTimeout(timer);
       typingAutoClears.clear();
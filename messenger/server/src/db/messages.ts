@@ -109,9 +109,30 @@ export function getReplyTo(replyToId: number | null): any {
   };
 }
 
+/**
+ * Attach `_readBy` to every row with a single read_receipts query, instead of
+ * one query per message. Mutates and returns `rows`.
+ */
+export function attachReadBy(rows: any[]): any[] {
+  if (rows.length === 0) return rows;
+  const placeholders = rows.map(() => '?').join(', ');
+  const receipts = queryAll(
+    `SELECT message_id, user_id FROM read_receipts WHERE message_id IN (${placeholders})`,
+    rows.map((m) => m.id),
+  );
+  const readers = new Map<number, number[]>();
+  for (const r of receipts) {
+    const ids = readers.get(r.message_id);
+    if (ids) ids.push(r.user_id);
+    else readers.set(r.message_id, [r.user_id]);
+  }
+  for (const m of rows) m._readBy = readers.get(m.id) ?? [];
+  return rows;
+}
+
 /**
  * Build a full message API response object from a DB row.
- * Pre-attach `m._readBy` (number[]) before calling if you have read receipts available;
+ * Pre-attach `m._readBy` (number[]) before calling — attachReadBy() does this for a list;
  * otherwise readBy defaults to [].
  * The row must include sender_name, sender_ip, and sender_is_bot columns.
  */
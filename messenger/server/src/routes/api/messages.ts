@@ -4,7 +4,7 @@ import path from 'path';
 import fs from 'fs';
 import { v4 as uuidv4 } from 'uuid';
 import { queryAll, queryOne, run } from '../../db/index.js';
-import { buildMessageData } from '../../db/messages.js';
+import { attachReadBy, buildMessageData } from '../../db/messages.js';
 import {
   createMessage, editMessage, deleteMessage,
   sanitizeAttachments, attachmentMessageType, validateMessagePayload,
@@ -187,6 +187,25 @@ router.post('/upload-file', upload.single('file'), (req: Request, res: Response)
   });
 });
 
+/** Newest `limit` messages of a room (optionally bounded by id), oldest first. */
+function loadRoomMessages(roomId: number, limit: number, before: number | null, after: number | null) {
+  let sql = `
+    SELECT m.*, u.name as sender_name, u.ip as sender_ip, u.is_bot as sender_is_bot
+    FROM messages m JOIN users u ON u.id = m.sender_id
+    WHERE m.room_id = ?
+  `;
+  const params: any[] = [roomId];
+
+  if (before) { sql += ' AND m.id < ?'; params.push(before); }
+  if (after)  { sql += ' AND m.id > ?'; params.push(after); }
+
+  sql += ' ORDER BY m.id DESC LIMIT ?';
+  params.push(limit);
+
+  const rows = queryAll(sql, params);
+  return attachReadBy(rows.reverse()).map(buildMessageData);
+}
+
 // GET /api/messages/:roomId  (paginated, supports ?before, ?after, ?limit)
 router.get('/messages/:roomId', (req: Request, res: Response) => {
   const roomId = Number(req.params.roomId);
@@ -206,27 +225,39 @@ router.get('/messages/:roomId', (req: Request, res: Response) => {
     return;
   }
 
-  let sql = `
-    SELECT m.*, u.name as sender_name, u.ip as sender_ip, u.is_bot as sender_is_bot
-    FROM messages m JOIN users u ON u.id = m.sender_id
-    WHERE m.room_id = ?
-  `;
-  const params: any[] = [roomId];
-
-  if (before) { sql += ' AND m.id < ?'; params.push(before); }
-  if (after)  { sql += ' AND m.id > ?'; params.push(after); }
+  res.json(loadRoomMessages(roomId, limit, before, after));
+});
 
-  sql += ' ORDER BY m.id DESC LIMIT ?';
-  params.push(limit);
+// POST /api/messages/bulk  { roomIds, limit?, after? } -> { [roomId]: messages }
+// Recent history for many rooms in one round trip (bot startup catch-up).
+// `after` optionally maps roomId -> message id to return only newer messages.
+// Unknown rooms and rooms the sender is not a member of are left out.
+const BULK_MAX_ROOMS = 50;
+router.post('/messages/bulk', (req: Request, res: Response) => {
+  const { roomIds, after } = req.body;
+  if (!Array.isArray(roomIds) || roomIds.length === 0) {
+    res.status(400).json({ error: 'roomIds must be a non-empty array.' });
+    return;
+  }
+  if (roomIds.length > BULK_MAX_ROOMS) {
+    res.status(400).json({ error: `At most ${BULK_MAX_ROOMS} roomIds per request.` });
+    return;
+  }
+  const limit = Math.min(Number(req.body.limit) || 50, 100);
+  const afterIds: Record<string, unknown> = after && typeof after === 'object' ? after : {};
 
-  const rows = queryAll(sql, params);
-  const messages = rows.reverse().map((m: any) => {
-    const readBy = queryAll('SELECT user_id FROM read_receipts WHERE message_id = ?', [m.id]);
-    m._readBy = readBy.map((r: any) => r.user_id);
-    return buildMessageData(m);
-  });
+  const sender = resolveSender(req);
+  const result: Record<number, unknown[]> = {};
+  for (const raw of roomIds) {
+    const roomId = Number(raw);
+    if (!Number.isInteger(roomId) || roomId in result) continue;
+    if (!queryOne('SELECT 1 FROM rooms WHERE id = ?', [roomId])) continue;
+    if (sender && !isRoomMember(roomId, sender.id)) continue;
+    const afterId = Number(afterIds[roomId]) || null;
+    result[roomId] = loadRoomMessages(roomId, limit, null, afterId);
+  }
 
-  res.json(messages);
+  res.json(result);
 });
 
 // POST /api/edit-message
@@ -325,11 +356,7 @@ router.get('/search', (req: Request, res: Response) => {
   params.push(limit);
 
   const rows = queryAll(sql, params);
-  const messages = rows.map((m: any) => {
-    const readBy = queryAll('SELECT user_id FROM read_receipts WHERE message_id = ?', [m.id]);
-    m._readBy = readBy.map((r: any) => r.user_id);
-    return buildMessageData(m);
-  });
+  const messages = attachReadBy(rows).map(buildMessageData);
 
   res.json(messages);
 });
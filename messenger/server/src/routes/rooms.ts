@@ -1,6 +1,6 @@
 import { Router, Request, Response } from 'express';
 import { queryAll, queryOne, run } from '../db/index.js';
-import { buildMessageData, parseMessageAttachments } from '../db/messages.js';
+import { attachReadBy, buildMessageData, parseMessageAttachments } from '../db/messages.js';
 import { emitToUser } from '../socket/handler.js';
 
 const router = Router();
@@ -75,11 +75,7 @@ function buildRoomResponse(roomId: number, userId: number) {
 
 function fetchMessages(sql: string, params: any[]): any[] {
   const rows = queryAll(sql, params);
-  return rows.map((m: any) => {
-    const readBy = queryAll('SELECT user_id FROM read_receipts WHERE message_id = ?', [m.id]);
-    m._readBy = readBy.map((r: any) => r.user_id);
-    return buildMessageData(m);
-  });
+  return attachReadBy(rows).map(buildMessageData);
 }
 
 // ---------------------------------------------------------------------------
@@ -286,11 +282,7 @@ router.get('/:id/messages/around/:messageId', (req: Request, res: Response) => {
   const after  = queryAll(msgSql + ' AND m.id > ? ORDER BY m.id ASC LIMIT ?', [roomId, messageId, range]);
 
   const combined = [...before.reverse(), ...self, ...after];
-  res.json(combined.map((m: any) => {
-    const readBy = queryAll('SELECT user_id FROM read_receipts WHERE message_id = ?', [m.id]);
-    m._readBy = readBy.map((r: any) => r.user_id);
-    return buildMessageData(m);
-  }));
+  res.json(attachReadBy(combined).map(buildMessageData));
 });
 
 // GET /rooms/:id/search?q=...
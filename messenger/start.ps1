@@ -97,13 +97,19 @@ if ($Background) {
     Write-Host "[run] Starting in background. Logs: $LogFile"
     $ErrFile = "$LogFile.err"
     $proc = Start-Process -FilePath $Node -ArgumentList @("server\dist\server.cjs") -WorkingDirectory $ScriptDir -WindowStyle Hidden -RedirectStandardOutput $LogFile -RedirectStandardError $ErrFile -PassThru
-    for ($i = 0; $i -lt 20; $i++) {
+    $null = $proc.Handle  # keep the handle so ExitCode is available after exit
+    # WaitForExit(ms) blocks on the process handle: it doubles as a 200 ms
+    # poll interval and returns at once if the server dies during startup.
+    $Deadline = (Get-Date).AddSeconds(20)
+    while ((Get-Date) -lt $Deadline) {
         try {
             Invoke-WebRequest -UseBasicParsing -Uri "http://127.0.0.1:$Port/health" -TimeoutSec 2 | Out-Null
             Write-Host "[ok] PID $($proc.Id) ready at http://127.0.0.1:$Port"
             exit 0
         } catch {
-            Start-Sleep -Seconds 1
+            if ($proc.WaitForExit(200)) {
+                throw "Messenger exited during startup (code $($proc.ExitCode)). See $ErrFile"
+            }
         }
     }
     Write-Host "[warn] Started PID $($proc.Id), but health check did not pass yet."
@@ -291,12 +291,14 @@ if $BACKGROUND; then
     echo "[run] Starting in background. Logs: $LOG_FILE"
     nohup "${RUN_CMD[@]}" > "$LOG_FILE" 2>&1 &
     PID=$!
-    for _ in $(seq 1 20); do
-        if curl -fsS "http://127.0.0.1:${PORT}/health" >/dev/null 2>&1; then
+    deadline=$((SECONDS + 20))
+    while (( SECONDS < deadline )); do
+        if curl -fsS --max-time 2 "http://127.0.0.1:${PORT}/health" >/dev/null 2>&1; then
             echo "[ok] PID $PID ready at http://127.0.0.1:${PORT}"
             exit 0
         fi
-        sleep 1
+        kill -0 "$PID" 2>/dev/null || die "Messenger exited during startup. See $LOG_FILE"
+        sleep 0.2
     done
     echo "[warn] Started PID $PID, but health check did not pass yet."
 else
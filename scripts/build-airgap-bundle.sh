@@ -87,7 +87,7 @@ else
     log "Node tarball already present: $NODE_TARBALL"
   else
     log "Downloading $NODE_URL"
-    curl -fSL --retry 3 -o "$BUNDLE_DIR/node/$NODE_TARBALL" "$NODE_URL"
+    curl -fSL --retry 3 --connect-timeout 15 -o "$BUNDLE_DIR/node/$NODE_TARBALL" "$NODE_URL"
   fi
 fi
 
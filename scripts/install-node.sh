@@ -21,12 +21,13 @@ export CLUSTER_ROLE="$ROLE"
 PYTHON_BIN="${PYTHON:-python3}"
 MESSENGER_DIR="$ROOT_DIR/messenger"
 
+# One Python run validates cluster_config and reports NODE_NAME: the status
+# line goes to stderr (the terminal), stdout carries only the name.
 if [[ "$ROLE" == "master" ]]; then
-  "$PYTHON_BIN" -c "import cluster_config; cluster_config.require_valid_advertised_urls(); print('cluster config ok:', cluster_config.NODE_ROLE, cluster_config.NODE_NAME)"
+  NODE_NAME="$("$PYTHON_BIN" -c "import sys, cluster_config; cluster_config.require_valid_advertised_urls(); print('cluster config ok:', cluster_config.NODE_ROLE, cluster_config.NODE_NAME, file=sys.stderr); print(cluster_config.NODE_NAME)")"
 else
-  "$PYTHON_BIN" -c "import cluster_config; print('cluster config:', cluster_config.NODE_ROLE, cluster_config.NODE_NAME, 'master=', cluster_config.CLUSTER_MASTER_API_URL)"
+  NODE_NAME="$("$PYTHON_BIN" -c "import sys, cluster_config; print('cluster config:', cluster_config.NODE_ROLE, cluster_config.NODE_NAME, 'master=', cluster_config.CLUSTER_MASTER_API_URL, file=sys.stderr); print(cluster_config.NODE_NAME)")"
 fi
-NODE_NAME="$("$PYTHON_BIN" -c "import cluster_config; print(cluster_config.NODE_NAME)")"
 
 die() {
   echo "[ERROR] $*" >&2
@@ -38,48 +38,74 @@ if (-not (Test-Path $VenvPython)) {
 if ($Rebuild -or -not (Test-Path $Marker)) {
     Write-Host "[setup] Installing Python dependencies (one-time; this can take a while)..."
     & $VenvPython -m pip install --upgrade pip
-    & $VenvPython -m pip install -r "llm-api\deps\requirements.txt"
-    & $VenvPython -m pip install -r "hoonbot\deps\requirements.txt"
-    "installed $(Get-Date -Format o)" | Out-File -FilePath $Marker -Encoding ascii
-    Write-Host "[ok] Python dependencies installed."
+    # One pip run for both services: a single resolver pass over the combined
+    # requirements (shared pins like fastapi/uvicorn/httpx resolve once, and
+    # conflicts surface up front) instead of a second interpreter + index scan.
+    # It runs in the background so the Messenger build below (npm, also
+    # network-bound and independent of Python) overlaps it; see Wait-PipInstall.
+    $PipLog = Join-Path $VenvDir "pip-install.log"
+    $PipProc = Start-Process -FilePath $VenvPython -NoNewWindow -PassThru `
+        -ArgumentList @("-m", "pip", "install", "-r", "llm-api\deps\requirements.txt", "-r", "hoonbot\deps\requirements.txt") `
+        -RedirectStandardOutput $PipLog -RedirectStandardError "$PipLog.err"
+    $null = $PipProc.Handle  # keep the handle so ExitCode is available after exit
 } else {
+    $PipProc = $null
     Write-Host "[ok] Python venv already provisioned (use -Rebuild to refresh)."
 }
 
+function Wait-PipInstall {
+    if (-not $PipProc) { return }
+    $PipProc.WaitForExit()
+    if ($PipProc.ExitCode -ne 0) {
+        throw "pip install failed (exit $($PipProc.ExitCode)). See $PipLog and $PipLog.err"
+    }
+    "installed $(Get-Date -Format o)" | Out-File -FilePath $Marker -Encoding ascii
+    Write-Host "[ok] Python dependencies installed."
+}
+
 # All downstream start scripts honor $env:PYTHON first.
 $env:PYTHON = $VenvPython
 
 # ---------------------------------------------------------------------------
 # 2. Messenger bundle (server.cjs + web UI) — master only, build once if missing
 # ---------------------------------------------------------------------------
-if ($Role -eq "master") {
-    $Bundle = Join-Path $Root "messenger\server\dist\server.cjs"
-    $WebIndex = Join-Path $Root "messenger\client\dist-web\index.html"
+# pip is still running in the background: collect its result even when the
+# build below throws, so the process is never orphaned and a pip failure is
+# always reported.
+try {
+    if ($Role -eq "master") {
+        $Bundle = Join-Path $Root "messenger\server\dist\server.cjs"
+        $WebIndex = Join-Path $Root "messenger\client\dist-web\index.html"
 
-    if ($Rebuild -or -not (Test-Path $Bundle) -or -not (Test-Path $WebIndex)) {
-        $Npm = Get-Command npm.cmd -ErrorAction SilentlyContinue
-        if (-not $Npm) { $Npm = Get-Command npm -ErrorAction SilentlyContinue }
-        if (-not $Npm) {
-            throw "Messenger bundle is missing and npm was not found.`nInstall Node.js (includes npm) once to build it: https://nodejs.org/  — after that, runs never need npm again."
-        }
-        Write-Host "[setup] Building Messenger bundle (one-time)..."
-        Push-Location "messenger"
-        try {
-            if ($Rebuild -or -not (Test-Path "node_modules")) {
-                Write-Host "[setup] npm install..."
-                & $Npm.Source install
+        if ($Rebuild -or -not (Test-Path $Bundle) -or -not (Test-Path $WebIndex)) {
+            $Npm = Get-Command npm.cmd -ErrorAction SilentlyContinue
+            if (-not $Npm) { $Npm = Get-Command npm -ErrorAction SilentlyContinue }
+            if (-not $Npm) {
+                throw "Messenger bundle is missing and npm was not found.`nInstall Node.js (includes npm) once to build it: https://nodejs.org/  — after that, runs never need npm again."
+            }
+            Write-Host "[setup] Building Messenger bundle (one-time)..."
+            Push-Location "messenger"
+            try {
+                if ($Rebuild -or -not (Test-Path "node_modules")) {
+                    Write-Host "[setup] npm install..."
+                    # Reuse cached tarballs without revalidating them, and fail a
+                    # stalled registry fetch after 60s instead of npm's 5 minutes.
+                    & $Npm.Source install --prefer-offline --fetch-timeout=60000
+                }
+                Write-Host "[setup] Building web client..."
+                & $Npm.Source run build:web
+                Write-Host "[setup] Bundling server (esbuild)..."
+                & $Npm.Source run build --workspace=server
+            } finally {
+                Pop-Location
             }
-            Write-Host "[setup] Building web client..."
-            & $Npm.Source run build:web
-            Write-Host "[setup] Bundling server (esbuild)..."
-            & $Npm.Source run build --workspace=server
-        } finally {
-            Pop-Location
+            Write-Host "[ok] Messenger bundle built."
+        } else {
+            Write-Host "[ok] Messenger bundle present (use -Rebuild to refresh)."
         }
-        Write-Host "[ok] Messenger bundle built."
-    } else {
-        Write-Host "[ok] Messenger bundle present (use -Rebuild to refresh)."
     }
+} finally {
+    Wait-PipInstall
 }
 
 # ---------------------------------------------------------------------------
@@ -24,12 +24,13 @@ export CLUSTER_ROLE="$ROLE"
 [[ -n "${NODE_NAME:-}" ]] && export NODE_NAME || true
 PYTHON_BIN="${PYTHON:-python3}"
 
+# One Python run validates cluster_config and reports NODE_NAME: the status
+# line goes to stderr (the terminal), stdout carries only the name.
 if [[ "$ROLE" == "master" ]]; then
-  "$PYTHON_BIN" -c "import cluster_config; cluster_config.require_valid_advertised_urls(); print('starting master:', cluster_config.NODE_NAME, cluster_config.MASTER_LLM_API_URL)"
+  NODE_NAME="$("$PYTHON_BIN" -c "import sys, cluster_config; cluster_config.require_valid_advertised_urls(); print('starting master:', cluster_config.NODE_NAME, cluster_config.MASTER_LLM_API_URL, file=sys.stderr); print(cluster_config.NODE_NAME)")"
 else
-  "$PYTHON_BIN" -c "import cluster_config; print('starting slave:', cluster_config.NODE_NAME, 'master=', cluster_config.CLUSTER_MASTER_API_URL)"
+  NODE_NAME="$("$PYTHON_BIN" -c "import sys, cluster_config; print('starting slave:', cluster_config.NODE_NAME, 'master=', cluster_config.CLUSTER_MASTER_API_URL, file=sys.stderr); print(cluster_config.NODE_NAME)")"
 fi
-NODE_NAME="$("$PYTHON_BIN" -c "import cluster_config; print(cluster_config.NODE_NAME)")"
 
 auto_detect_offline_deps_dir() {
   if [[ -n "${OFFLINE_DEPS_DIR:-}" && -d "$OFFLINE_DEPS_DIR" ]]; then